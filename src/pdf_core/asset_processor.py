@@ -5,11 +5,17 @@ Handles automatic asset encoding, optimization, validation, and batch processing
 """
 
 import base64
+import functools
 import hashlib
 import json
 import logging
 import mimetypes
+import mmap
 import os
+import pickle
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass, field
@@ -21,9 +27,65 @@ try:
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
-    
+
+try:
+    # SIMD-accelerated drop-in replacement for base64 (SSSE3/AVX2 kernels),
+    # ~5-10x faster on large blobs. Falls back to the stdlib encoder.
+    import pybase64 as _b64
+    HAS_PYBASE64 = True
+except ImportError:
+    _b64 = base64
+    HAS_PYBASE64 = False
+
+try:
+    # NumPy lets the RGBA->RGB flatten run as a few vectorized ufunc passes
+    # instead of PIL's generic convert path (which also composites over black)
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    # BLAKE3 runs several times faster than SHA-256 on large buffers; the
+    # checksum is only used for round-trip validation, so the algorithm is
+    # interchangeable as long as it's recorded alongside the asset.
+    from blake3 import blake3 as _checksum_hash
+    _CHECKSUM_ALGO = 'blake3'
+except ImportError:
+    from hashlib import sha256 as _checksum_hash
+    _CHECKSUM_ALGO = 'sha256'
+
+
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__ (real RSS savings on
+# large batches) but need Python >= 3.10
+_SLOTS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Minification patterns compiled once so hot batch loops skip per-call setup
+_SVG_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# MIME fallbacks for types mimetypes doesn't always know
+_MIME_FALLBACKS = {
+    '.svg': 'image/svg+xml',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+    '.css': 'text/css',
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _mime_for_suffix(suffix: str) -> str:
+    """Resolve a MIME type from a lowercase file suffix (cached per suffix)."""
+    mime_type, _ = mimetypes.guess_type(f"file{suffix}")
+    if not mime_type:
+        mime_type = _MIME_FALLBACKS.get(suffix, 'application/octet-stream')
+    return mime_type
+
 
 class AssetType(Enum):
     """Supported asset types."""
@@ -44,7 +106,43 @@ class ImageFormat(Enum):
     WEBP = "webp"
 
 
-@dataclass
+def _flatten_to_rgb(img: "Image.Image") -> "Image.Image":
+    """
+    Flatten an image with alpha onto a white background, returning RGB.
+
+    Uses a single vectorized NumPy composite when available; otherwise falls
+    back to PIL's alpha_composite. Either way the result composites over
+    white rather than the black background .convert('RGB') would produce.
+    """
+    if img.mode == 'RGB':
+        return img
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+
+    if HAS_NUMPY:
+        arr = np.asarray(img, dtype=np.uint8)
+        alpha = arr[..., 3:4].astype(np.float32) / 255.0
+        rgb = (arr[..., :3].astype(np.float32) * alpha + 255.0 * (1.0 - alpha)).astype(np.uint8)
+        return Image.fromarray(rgb, 'RGB')
+
+    background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+    return Image.alpha_composite(background, img).convert('RGB')
+
+
+@functools.lru_cache(maxsize=64)
+def _asset_type_for_extension(extension: str) -> AssetType:
+    """Classify an asset type from a lowercase extension (cached per extension)."""
+    if extension == '.ico':
+        return AssetType.ICON
+    if extension in {'.woff', '.woff2', '.ttf', '.otf', '.eot'}:
+        return AssetType.FONT
+    if extension in {'.css', '.scss', '.sass'}:
+        return AssetType.CSS
+    # Default to image for raster/vector and unknown types alike
+    return AssetType.IMAGE
+
+
+@dataclass(**_SLOTS_KWARGS)
 class ProcessedAsset:
     """Represents a processed asset ready for upload."""
     
@@ -54,8 +152,9 @@ class ProcessedAsset:
     mime_type: str
     original_size: int
     processed_size: int
-    base64_data: str
+    base64_data: Optional[str]
     checksum: str
+    base64_stream_bytes: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     optimized: bool = False
     optimization_savings: int = 0
@@ -111,21 +210,32 @@ class AssetProcessor:
         AssetType.CSS: {'.css', '.scss', '.sass'},
     }
     
-    def __init__(self, optimize_images: bool = True, 
+    def __init__(self, optimize_images: bool = True,
                  convert_to_web_formats: bool = True,
-                 max_image_dimension: int = 2048):
+                 max_image_dimension: int = 2048,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 fast_mode: bool = False):
         """
         Initialize the asset processor.
-        
+
         Args:
             optimize_images: Whether to optimize images
             convert_to_web_formats: Convert images to web-friendly formats
             max_image_dimension: Maximum dimension for image resizing
+            cache_dir: Optional directory for caching processed results.
+                      Unchanged files (same path, mtime, size and options)
+                      are served from the cache without re-encoding.
+            fast_mode: Trade a few percent of output size for much faster
+                      encoding (skips libjpeg's optimize/progressive passes
+                      and uses the lightest PNG compression level). Suited
+                      to interactive/preview pipelines.
         """
         self.optimize_images = optimize_images and HAS_PIL
         self.convert_to_web_formats = convert_to_web_formats
         self.max_image_dimension = max_image_dimension
-        
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.fast_mode = fast_mode
+
         if not HAS_PIL and optimize_images:
             logger.warning("PIL not installed. Image optimization disabled.")
     
@@ -165,28 +275,44 @@ class AssetProcessor:
             raise ValueError(f"Unsupported file type for {asset_type.value}: {file_path.suffix}")
         
         # Get file info
-        original_size = file_path.stat().st_size
+        file_stat = file_path.stat()
+        original_size = file_stat.st_size
         mime_type = self._get_mime_type(file_path)
         filename = custom_name or file_path.name
-        
+
+        # Serve unchanged files from the cache without re-encoding
+        cache_path = None
+        if self.cache_dir:
+            cache_key = self._cache_key(file_path, file_stat, asset_type, optimize, custom_name)
+            cache_path = self.cache_dir / cache_key[:2] / cache_key
+            cached = self._load_cached_asset(cache_path)
+            if cached is not None:
+                logger.debug(f"Asset cache hit: {file_path}")
+                return cached
+
         # Process based on type
         if asset_type in [AssetType.IMAGE, AssetType.LOGO, AssetType.ICON, AssetType.BACKGROUND]:
             data, processed_size, metadata, warnings = self._process_image(
                 file_path, asset_type, optimize if optimize is not None else self.optimize_images
             )
+            mime_type = self._optimized_mime_type(metadata, mime_type)
         else:
             # For non-image assets, just read and encode
             data, processed_size, metadata, warnings = self._process_other(file_path)
-        
-        # Calculate checksum
-        checksum = hashlib.sha256(data).hexdigest()
-        
-        # Encode to base64
-        base64_data = base64.b64encode(data).decode('utf-8')
-        
+
+        # Hash and encode back-to-back while the buffer is still hot in cache.
+        # Both accept any buffer-protocol object, so no intermediate bytes copy
+        # is needed; base64 is pure ASCII so skip UTF-8 validation on decode.
+        checksum = _checksum_hash(data).hexdigest()
+        base64_data = _b64.b64encode(data).decode('ascii')
+        metadata['checksum_algo'] = _CHECKSUM_ALGO
+
+        if isinstance(data, mmap.mmap):
+            data.close()
+
         processing_time = time.time() - start_time
-        
-        return ProcessedAsset(
+
+        asset = ProcessedAsset(
             original_path=file_path,
             filename=filename,
             asset_type=asset_type,
@@ -201,32 +327,149 @@ class AssetProcessor:
             processing_time=processing_time,
             warnings=warnings
         )
+
+        if cache_path is not None:
+            self._store_cached_asset(cache_path, asset)
+
+        return asset
     
-    def process_batch(self, file_paths: List[Union[str, Path]], 
+    # Streaming chunk size: multiple of 3 bytes so every base64 block is
+    # emitted without padding until the final one.
+    STREAM_CHUNK_SIZE = 48 * 1024
+
+    def process_asset_stream(self, file_path: Union[str, Path],
+                             out_io,
+                             asset_type: Optional[AssetType] = None,
+                             custom_name: Optional[str] = None,
+                             optimize: Optional[bool] = None) -> ProcessedAsset:
+        """
+        Process an asset and stream its base64 encoding to a binary IO.
+
+        Unlike process_asset, the encoded payload is written to out_io in
+        fixed-size chunks instead of being materialized as one large string,
+        keeping peak memory flat regardless of asset size. The checksum is
+        accumulated incrementally over the same chunks.
+
+        Args:
+            file_path: Path to the asset file
+            out_io: Writable binary IO receiving the base64-encoded data
+            asset_type: Type of asset (auto-detected if not provided)
+            custom_name: Custom filename for the asset
+            optimize: Override optimization setting
+
+        Returns:
+            ProcessedAsset with base64_data=None and base64_stream_bytes set
+            to the number of encoded bytes written
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file type is not supported
+        """
+        import time
+        start_time = time.time()
+
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Asset file not found: {file_path}")
+
+        if asset_type is None:
+            asset_type = self._detect_asset_type(file_path)
+
+        if not self._is_supported_extension(file_path, asset_type):
+            raise ValueError(f"Unsupported file type for {asset_type.value}: {file_path.suffix}")
+
+        original_size = file_path.stat().st_size
+        mime_type = self._get_mime_type(file_path)
+        filename = custom_name or file_path.name
+
+        if asset_type in [AssetType.IMAGE, AssetType.LOGO, AssetType.ICON, AssetType.BACKGROUND]:
+            data, processed_size, metadata, warnings = self._process_image(
+                file_path, asset_type, optimize if optimize is not None else self.optimize_images
+            )
+            mime_type = self._optimized_mime_type(metadata, mime_type)
+        else:
+            data, processed_size, metadata, warnings = self._process_other(file_path)
+
+        # Stream in aligned chunks: hash and encode each block, write it out,
+        # and never hold more than one encoded chunk at a time.
+        hasher = _checksum_hash()
+        n_written = 0
+        metadata['checksum_algo'] = _CHECKSUM_ALGO
+        view = memoryview(data) if not isinstance(data, memoryview) else data
+        for offset in range(0, len(view), self.STREAM_CHUNK_SIZE):
+            block = view[offset:offset + self.STREAM_CHUNK_SIZE]
+            hasher.update(block)
+            n_written += out_io.write(_b64.b64encode(block))
+            del block
+
+        if view is not data:
+            view.release()
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+        processing_time = time.time() - start_time
+
+        return ProcessedAsset(
+            original_path=file_path,
+            filename=filename,
+            asset_type=asset_type,
+            mime_type=mime_type,
+            original_size=original_size,
+            processed_size=processed_size,
+            base64_data=None,
+            checksum=hasher.hexdigest(),
+            base64_stream_bytes=n_written,
+            metadata=metadata,
+            optimized=optimize if optimize is not None else self.optimize_images,
+            optimization_savings=original_size - processed_size,
+            processing_time=processing_time,
+            warnings=warnings
+        )
+
+    def process_batch(self, file_paths: List[Union[str, Path]],
                      asset_type: Optional[AssetType] = None,
-                     optimize: Optional[bool] = None) -> List[ProcessedAsset]:
+                     optimize: Optional[bool] = None,
+                     max_workers: Optional[int] = None) -> List[ProcessedAsset]:
         """
-        Process multiple asset files.
-        
+        Process multiple asset files in parallel.
+
+        Files are dispatched to a thread pool (PIL and file I/O release the GIL
+        in native code), so batch latency approaches the slowest single file
+        rather than the sum of all files.
+
         Args:
             file_paths: List of file paths to process
             asset_type: Type for all assets (auto-detected individually if not provided)
             optimize: Override optimization setting
-            
+            max_workers: Number of worker threads (defaults to cpu_count)
+
         Returns:
-            List of ProcessedAsset objects
+            List of ProcessedAsset objects in input order (failed files are
+            logged and skipped)
         """
-        processed = []
-        
-        for file_path in file_paths:
+        if not file_paths:
+            return []
+
+        def _process_one(file_path: Union[str, Path]) -> Optional[ProcessedAsset]:
+            # Exceptions are caught per-item so one bad file can't stall the pool
             try:
-                asset = self.process_asset(file_path, asset_type, optimize=optimize)
-                processed.append(asset)
-                logger.info(f"Processed {file_path}: {asset.processed_size:,} bytes "
-                          f"({asset.size_reduction_percent:.1f}% reduction)")
+                return self.process_asset(file_path, asset_type, optimize=optimize)
             except Exception as e:
                 logger.error(f"Failed to process {file_path}: {e}")
-                
+                return None
+
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_process_one, file_paths))
+
+        processed = []
+        for asset in results:
+            if asset is not None:
+                processed.append(asset)
+                logger.info(f"Processed {asset.original_path}: {asset.processed_size:,} bytes "
+                          f"({asset.size_reduction_percent:.1f}% reduction)")
+
         return processed
     
     def validate_asset(self, asset: ProcessedAsset) -> Tuple[bool, List[str]]:
@@ -246,10 +489,13 @@ class AssetProcessor:
         if max_size and asset.processed_size > max_size:
             issues.append(f"Size {asset.processed_size:,} bytes exceeds limit of {max_size:,} bytes")
         
-        # Check base64 encoding
+        # Check base64 encoding, re-hashing with whatever algorithm the
+        # asset was originally checksummed with
         try:
-            decoded = base64.b64decode(asset.base64_data)
-            if hashlib.sha256(decoded).hexdigest() != asset.checksum:
+            decoded = _b64.b64decode(asset.base64_data)
+            algo = asset.metadata.get('checksum_algo', 'sha256')
+            hasher = _checksum_hash if algo == _CHECKSUM_ALGO else hashlib.sha256
+            if hasher(decoded).hexdigest() != asset.checksum:
                 issues.append("Checksum mismatch after encoding")
         except Exception as e:
             issues.append(f"Invalid base64 encoding: {e}")
@@ -263,24 +509,17 @@ class AssetProcessor:
     def _detect_asset_type(self, file_path: Path) -> AssetType:
         """Auto-detect asset type from file path and extension."""
         filename = file_path.name.lower()
-        extension = file_path.suffix.lower()
-        
-        # Check by filename patterns
+
+        # Check by filename patterns (too varied to cache usefully)
         if 'logo' in filename:
             return AssetType.LOGO
-        elif 'icon' in filename or extension == '.ico':
+        elif 'icon' in filename:
             return AssetType.ICON
         elif 'background' in filename or 'bg' in filename:
             return AssetType.BACKGROUND
-        elif extension in {'.woff', '.woff2', '.ttf', '.otf', '.eot'}:
-            return AssetType.FONT
-        elif extension in {'.css', '.scss', '.sass'}:
-            return AssetType.CSS
-        elif extension in {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp'}:
-            return AssetType.IMAGE
-        else:
-            # Default to image for unknown types
-            return AssetType.IMAGE
+
+        # Extension-only classification is cached across the batch
+        return _asset_type_for_extension(file_path.suffix.lower())
     
     def _is_supported_extension(self, file_path: Path, asset_type: AssetType) -> bool:
         """Check if file extension is supported for the asset type."""
@@ -288,25 +527,71 @@ class AssetProcessor:
         supported = self.SUPPORTED_EXTENSIONS.get(asset_type, set())
         return extension in supported
     
+    def _cache_key(self, file_path: Path, file_stat: os.stat_result,
+                   asset_type: AssetType, optimize: Optional[bool],
+                   custom_name: Optional[str]) -> str:
+        """Build a cache key from file identity (no read) plus processing options."""
+        key_source = "|".join((
+            str(file_path),
+            str(file_stat.st_mtime_ns),
+            str(file_stat.st_size),
+            asset_type.value,
+            str(optimize),
+            str(custom_name),
+            str(self.optimize_images),
+            str(self.convert_to_web_formats),
+            str(self.max_image_dimension),
+            str(self.fast_mode),
+        ))
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def _load_cached_asset(self, cache_path: Path) -> Optional[ProcessedAsset]:
+        """Load a cached ProcessedAsset, returning None on miss or corruption."""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read asset cache entry {cache_path}: {e}")
+            return None
+
+    def _store_cached_asset(self, cache_path: Path, asset: ProcessedAsset) -> None:
+        """Atomically persist a ProcessedAsset to the cache."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(asset, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write asset cache entry {cache_path}: {e}")
+
+    def _optimized_mime_type(self, metadata: Dict[str, Any], default: str) -> str:
+        """Resolve the MIME type for an image whose format changed during optimization."""
+        optimized_format = metadata.get('optimized_format')
+        if optimized_format:
+            return {
+                'JPEG': 'image/jpeg',
+                'PNG': 'image/png',
+                'WEBP': 'image/webp',
+                'GIF': 'image/gif',
+            }.get(optimized_format, default)
+        return default
+
     def _get_mime_type(self, file_path: Path) -> str:
-        """Get MIME type for a file."""
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if not mime_type:
-            # Fallback for common types
-            extension_map = {
-                '.svg': 'image/svg+xml',
-                '.woff': 'font/woff',
-                '.woff2': 'font/woff2',
-                '.ttf': 'font/ttf',
-                '.otf': 'font/otf',
-                '.css': 'text/css',
-            }
-            mime_type = extension_map.get(file_path.suffix.lower(), 'application/octet-stream')
-        return mime_type
+        """Get MIME type for a file (cached by suffix across hot batches)."""
+        return _mime_for_suffix(file_path.suffix.lower())
     
-    def _process_image(self, file_path: Path, asset_type: AssetType, 
-                      optimize: bool) -> Tuple[bytes, int, Dict[str, Any], List[str]]:
-        """Process image assets with optional optimization."""
+    def _process_image(self, file_path: Path, asset_type: AssetType,
+                      optimize: bool) -> Tuple[Union[bytes, memoryview], int, Dict[str, Any], List[str]]:
+        """
+        Process image assets with optional optimization.
+
+        Returns the processed data as a bytes-like object; the optimized path
+        hands back a memoryview over the encoder's buffer so callers can hash
+        and base64-encode it without an extra copy.
+        """
         warnings = []
         metadata = {}
         
@@ -320,10 +605,9 @@ class AssetProcessor:
                 try:
                     svg_text = data.decode('utf-8')
                     # Remove comments
-                    import re
-                    svg_text = re.sub(r'<!--.*?-->', '', svg_text, flags=re.DOTALL)
+                    svg_text = _SVG_COMMENT_RE.sub('', svg_text)
                     # Remove excessive whitespace
-                    svg_text = re.sub(r'\s+', ' ', svg_text)
+                    svg_text = _WHITESPACE_RE.sub(' ', svg_text)
                     svg_text = svg_text.strip()
                     data = svg_text.encode('utf-8')
                 except Exception as e:
@@ -352,55 +636,91 @@ class AssetProcessor:
             metadata['original_format'] = original_format
             
             if optimize:
-                # Resize if needed
+                # Fast path: when the source already fits the target
+                # dimensions and sits comfortably under its size limit,
+                # re-encoding can only burn CPU for marginal gains. Image.open
+                # only parses headers, so this probe never decodes pixels.
                 target_dims = self.TARGET_DIMENSIONS.get(asset_type)
+                max_size = self.MAX_SIZES.get(asset_type)
+                file_size = file_path.stat().st_size
+                if (max_size and file_size <= 0.8 * max_size
+                        and (not target_dims
+                             or (original_size[0] <= target_dims[0]
+                                 and original_size[1] <= target_dims[1]))):
+                    data = file_path.read_bytes()
+                    metadata['optimization_skipped'] = 'already_optimized'
+                    return data, len(data), metadata, warnings
+
+                # Resize if needed
                 if target_dims:
-                    # Calculate scaling to fit within target dimensions
-                    scale = min(
-                        target_dims[0] / original_size[0],
-                        target_dims[1] / original_size[1],
-                        1.0  # Don't upscale
-                    )
-                    
-                    if scale < 1.0:
-                        new_size = (
-                            int(original_size[0] * scale),
-                            int(original_size[1] * scale)
-                        )
-                        img = img.resize(new_size, Image.Resampling.LANCZOS)
+                    if original_format == 'JPEG':
+                        # Let libjpeg decode directly at 1/2, 1/4 or 1/8 scale
+                        # instead of full resolution followed by resampling
+                        img.draft('RGB', target_dims)
+
+                    # thumbnail() never upscales and preserves aspect ratio;
+                    # reducing_gap does a fast box-filter reduction first and
+                    # only applies Lanczos near the target size
+                    img.thumbnail(target_dims, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+                    if img.size != original_size:
+                        new_size = img.size
                         metadata['resized_to'] = f"{new_size[0]}x{new_size[1]}"
                         warnings.append(f"Image resized from {original_size} to {new_size}")
                 
-                # Convert RGBA to RGB for JPEG
-                if original_format == 'PNG' and self.convert_to_web_formats:
-                    # Check if image has transparency
-                    if img.mode == 'RGBA':
-                        # Keep PNG for transparent images
-                        output_format = 'PNG'
-                    else:
-                        # Convert to JPEG for non-transparent images
-                        if img.mode == 'RGBA':
-                            img = img.convert('RGB')
-                        output_format = 'JPEG'
+                # Pick output format: WebP is ~20-35% smaller than JPEG at
+                # equal perceptual quality and natively supported by the
+                # Chromium renderer, so prefer it for web-format conversion.
+                if self.convert_to_web_formats:
+                    output_format = 'WEBP'
                 else:
                     output_format = original_format or 'PNG'
-                
-                # Save optimized image
-                output = BytesIO()
-                save_kwargs = {
-                    'format': output_format,
-                    'optimize': True,
-                }
-                
-                if output_format == 'JPEG':
-                    save_kwargs['quality'] = 85
-                    save_kwargs['progressive'] = True
-                elif output_format == 'PNG':
-                    save_kwargs['compress_level'] = 9
-                
+
+                # Save optimized image; pre-size the buffer to the original
+                # file size so the encoder never triggers geometric
+                # reallocations mid-write (trimmed back after the save)
+                output = BytesIO(bytearray(max(1024, file_size)))
+                output.seek(0)
+
+                if output_format == 'WEBP':
+                    if img.mode not in ('RGB', 'RGBA'):
+                        # WebP encoder needs RGB(A); palette images go through RGBA
+                        # so any transparency survives the conversion
+                        img = img.convert('RGBA' if 'transparency' in img.info or img.mode == 'P' else 'RGB')
+                    if img.mode == 'RGBA' and asset_type in (AssetType.LOGO, AssetType.ICON):
+                        # Lossless WebP keeps transparency crisp for logos and
+                        # icons while still compressing better than PNG
+                        save_kwargs = {'format': 'WEBP', 'lossless': True, 'method': 6}
+                    else:
+                        save_kwargs = {'format': 'WEBP', 'quality': 82, 'method': 6}
+                else:
+                    save_kwargs = {
+                        'format': output_format,
+                        'optimize': True,
+                    }
+                    if output_format == 'JPEG':
+                        if img.mode != 'RGB':
+                            # JPEG has no alpha channel; flatten onto white
+                            img = _flatten_to_rgb(img)
+                        save_kwargs['quality'] = 85
+                        if self.fast_mode:
+                            # Huffman optimization and progressive scans each
+                            # roughly double encode time but only help network
+                            # delivery, not PDF embedding
+                            save_kwargs['optimize'] = False
+                        else:
+                            save_kwargs['progressive'] = True
+                    elif output_format == 'PNG':
+                        save_kwargs['compress_level'] = 1 if self.fast_mode else 9
+                        if self.fast_mode:
+                            save_kwargs['optimize'] = False
+
                 img.save(output, **save_kwargs)
-                data = output.getvalue()
-                
+                # Trim the preallocated tail, then expose the BytesIO buffer
+                # directly instead of copying it out
+                output.truncate(output.tell())
+                data = output.getbuffer()
+
                 metadata['optimized_format'] = output_format
                 metadata['optimized_dimensions'] = f"{img.size[0]}x{img.size[1]}"
             else:
@@ -416,33 +736,45 @@ class AssetProcessor:
             
         return data, len(data), metadata, warnings
     
-    def _process_other(self, file_path: Path) -> Tuple[bytes, int, Dict[str, Any], List[str]]:
-        """Process non-image assets."""
+    def _process_other(self, file_path: Path) -> Tuple[Union[bytes, mmap.mmap], int, Dict[str, Any], List[str]]:
+        """
+        Process non-image assets.
+
+        CSS files are read into memory for text minification. Other files
+        (fonts etc.) are memory-mapped so the subsequent hash and base64
+        passes consume the kernel page cache directly instead of a heap copy;
+        callers close the mapping once the data has been consumed.
+        """
         warnings = []
         metadata = {
             'format': file_path.suffix[1:].lower() if file_path.suffix else 'unknown'
         }
-        
-        # Read file
-        with open(file_path, 'rb') as f:
-            data = f.read()
-        
+
         # For CSS files, we could do minification
         if file_path.suffix.lower() == '.css':
+            with open(file_path, 'rb') as f:
+                data = f.read()
             try:
                 css_text = data.decode('utf-8')
                 # Basic CSS minification (remove comments and excessive whitespace)
-                import re
-                # Remove comments
-                css_text = re.sub(r'/\*.*?\*/', '', css_text, flags=re.DOTALL)
-                # Remove excessive whitespace
-                css_text = re.sub(r'\s+', ' ', css_text)
+                css_text = _CSS_COMMENT_RE.sub('', css_text)
+                css_text = _WHITESPACE_RE.sub(' ', css_text)
                 css_text = css_text.strip()
                 data = css_text.encode('utf-8')
                 metadata['minified'] = True
             except Exception as e:
                 warnings.append(f"CSS minification failed: {e}")
-        
+            return data, len(data), metadata, warnings
+
+        # The mapping stays valid after the descriptor is closed; empty files
+        # can't be mapped, so fall back to a plain read for those.
+        try:
+            with open(file_path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            with open(file_path, 'rb') as f:
+                data = f.read()
+
         return data, len(data), metadata, warnings
 
 
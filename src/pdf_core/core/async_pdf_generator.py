@@ -5,12 +5,13 @@ Handles Playwright browser integration and HTML to PDF conversion with
 print optimization and brand-specific formatting using async API.
 """
 
+import asyncio
 import logging
-import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 
+import aiofiles
 from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
 
 from .template_engine import RenderedTemplate
@@ -18,6 +19,32 @@ from .pdf_generator import PDFConfig, GeneratedPDF  # Import existing dataclasse
 
 logger = logging.getLogger(__name__)
 
+# Static print-color CSS injected into every document. Registered once as a
+# context init script so it survives set_content and costs no per-page
+# protocol round-trip.
+_PDF_STYLE_INIT_SCRIPT = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = `
+        @page {
+            -webkit-print-color-adjust: exact;
+            color-adjust: exact;
+        }
+
+        body {
+            -webkit-print-color-adjust: exact;
+            print-color-adjust: exact;
+        }
+
+        * {
+            -webkit-print-color-adjust: exact;
+            print-color-adjust: exact;
+        }
+    `;
+    document.head.appendChild(style);
+});
+"""
+
 
 class AsyncPDFGenerator:
     """
@@ -32,18 +59,33 @@ class AsyncPDFGenerator:
     - Async/await compatibility
     """
     
-    def __init__(self, headless: bool = True, browser_args: Optional[list] = None):
+    def __init__(self, headless: bool = True, browser_args: Optional[list] = None,
+                 max_concurrent_pages: int = 4,
+                 cdp_endpoint: Optional[str] = None,
+                 user_data_dir: Optional[Union[str, Path]] = None):
         """
         Initialize the AsyncPDFGenerator.
-        
+
         Args:
             headless: Whether to run browser in headless mode
             browser_args: Additional browser launch arguments
+            max_concurrent_pages: Size of the reusable page pool; concurrent
+                generate_pdf calls beyond this limit wait for a free page
+            cdp_endpoint: Attach to an already-running Chromium over CDP
+                instead of launching one, skipping cold-start entirely
+            user_data_dir: Launch a persistent browser profile so warm
+                invocations reuse the on-disk cache
         """
         self.headless = headless
         self.browser_args = browser_args or []
+        self.max_concurrent_pages = max_concurrent_pages
+        self.cdp_endpoint = cdp_endpoint
+        self.user_data_dir = user_data_dir
         self.playwright = None
         self.browser = None
+        self.context = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._page_pool: Optional[asyncio.Queue] = None
         
     async def __aenter__(self):
         """Async context manager entry - start browser."""
@@ -58,43 +100,121 @@ class AsyncPDFGenerator:
         """Start Playwright browser instance."""
         try:
             self.playwright = await async_playwright().start()
-            
-            # Launch browser with optimized settings for PDF generation
-            launch_options = {
-                'headless': self.headless,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--font-render-hinting=none',
-                    '--disable-font-subpixel-positioning',
-                ] + self.browser_args
-            }
-            
-            self.browser = await self.playwright.chromium.launch(**launch_options)
+
+            browser_args = [
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--disable-web-security',
+                '--font-render-hinting=none',
+                '--disable-font-subpixel-positioning',
+            ] + self.browser_args
+
+            if self.cdp_endpoint:
+                # Attach to a pre-warmed browser instead of paying launch cost
+                self.browser = await self.playwright.chromium.connect_over_cdp(
+                    self.cdp_endpoint
+                )
+                self.context = await self.browser.new_context(
+                    viewport={"width": 1200, "height": 1600}
+                )
+            elif self.user_data_dir:
+                # Persistent profile: disk cache and font data survive across
+                # process restarts, so warm starts skip re-downloading assets
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    str(self.user_data_dir),
+                    headless=self.headless,
+                    args=browser_args,
+                    viewport={"width": 1200, "height": 1600},
+                )
+                self.browser = self.context.browser
+            else:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless, args=browser_args
+                )
+
+                # One shared context for all pages: its HTTP cache persists
+                # across documents, so repeated fonts/images/CSS are decoded
+                # only once
+                self.context = await self.browser.new_context(
+                    viewport={"width": 1200, "height": 1600}
+                )
+            await self.context.add_init_script(script=_PDF_STYLE_INIT_SCRIPT)
+
+            # Pre-populate a bounded pool of configured pages; generate_pdf
+            # borrows from it instead of paying page setup per document
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+            self._page_pool = asyncio.Queue()
+            for _ in range(self.max_concurrent_pages):
+                page = await self.context.new_page()
+                await self._configure_page_for_pdf(page)
+                self._page_pool.put_nowait(page)
+
             logger.info("Async browser started successfully")
-            
+
         except Exception as e:
             logger.error(f"Failed to start async browser: {e}")
             raise RuntimeError(f"Async browser startup failed: {e}")
-            
+
     async def _stop_browser(self) -> None:
         """Stop Playwright browser instance."""
         try:
+            if self._page_pool:
+                while not self._page_pool.empty():
+                    page = self._page_pool.get_nowait()
+                    await page.close()
+                self._page_pool = None
+                self._semaphore = None
+
+            if self.context:
+                await self.context.close()
+                self.context = None
+                logger.debug("Async browser context stopped")
+
             if self.browser:
                 await self.browser.close()
                 self.browser = None
                 logger.debug("Async browser stopped")
-                
+
             if self.playwright:
                 await self.playwright.stop()
                 self.playwright = None
                 logger.debug("Async playwright stopped")
-                
+
         except Exception as e:
             logger.warning(f"Error stopping async browser: {e}")
-            
+
+    async def _return_page(self, page: Page, healthy: bool) -> None:
+        """
+        Return a page to the pool, replacing it if its state is suspect.
+
+        A page whose job failed — or that cannot be blanked for reuse —
+        may be crashed or closed; putting it back would poison every
+        later job that draws it, so it is swapped for a freshly
+        configured page instead.
+
+        Args:
+            page: The borrowed page being returned
+            healthy: Whether the job that used the page completed cleanly
+        """
+        if healthy:
+            try:
+                # Blank the document so the next job starts clean
+                await page.evaluate("() => { document.open(); document.close(); }")
+                self._page_pool.put_nowait(page)
+                return
+            except Exception as e:
+                logger.debug(f"Could not reset page for reuse, replacing: {e}")
+
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing discarded page: {e}")
+
+        replacement = await self.context.new_page()
+        await self._configure_page_for_pdf(replacement)
+        self._page_pool.put_nowait(replacement)
+
     async def generate_pdf(
         self,
         rendered_template: RenderedTemplate,
@@ -107,8 +227,10 @@ class AsyncPDFGenerator:
         Args:
             rendered_template: Rendered HTML template from TemplateEngine
             pdf_config: PDF generation configuration
-            output_path: Output file path (overrides config)
-            
+            output_path: Output file path (overrides config). When neither
+                this nor config.output_path is set, the PDF is returned
+                in memory via GeneratedPDF.pdf_bytes without touching disk.
+
         Returns:
             GeneratedPDF object with metadata
             
@@ -116,67 +238,73 @@ class AsyncPDFGenerator:
             RuntimeError: If browser is not started or PDF generation fails
             PlaywrightTimeoutError: If page loading times out
         """
-        if not self.browser:
+        if self.context is None:
             raise RuntimeError("Async browser not started. Use async context manager or call _start_browser()")
             
         config = pdf_config or PDFConfig()
         
-        # Determine output path
+        # Determine output path; without one the PDF stays in memory and is
+        # returned via GeneratedPDF.pdf_bytes instead of a temp file round-trip
         if output_path:
             final_output_path = Path(output_path)
         elif config.output_path:
             final_output_path = config.output_path
         else:
-            # Generate temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
-            final_output_path = Path(temp_file.name)
-            temp_file.close()
-            
-        final_output_path.parent.mkdir(parents=True, exist_ok=True)
-        
+            final_output_path = None
+
+        if final_output_path is not None:
+            final_output_path.parent.mkdir(parents=True, exist_ok=True)
+
         start_time = __import__('time').time()
-        
+
         try:
-            # Create new page with optimized settings
-            page = await self.browser.new_page()
-            
-            # Set viewport for consistent rendering
-            await page.set_viewport_size({"width": 1200, "height": 1600})
-            
-            # Configure page for PDF generation
-            await self._configure_page_for_pdf(page)
-            
-            # Load HTML content
-            logger.info("Loading HTML content into async browser")
-            await page.set_content(rendered_template.html_content, wait_until="networkidle", timeout=config.timeout)
-            
-            # Wait for fonts to load
-            if config.wait_for_fonts > 0:
-                logger.debug(f"Waiting {config.wait_for_fonts}ms for fonts to load")
-                await page.wait_for_timeout(config.wait_for_fonts)
-            
-            # Generate PDF
-            logger.info(f"Generating PDF: {final_output_path}")
-            pdf_options = self._build_pdf_options(config, rendered_template)
-            
-            pdf_bytes = await page.pdf(**pdf_options)
-            
-            # Write PDF to file
-            with open(final_output_path, 'wb') as f:
-                f.write(pdf_bytes)
-                
-            await page.close()
-            
+            # Borrow a pre-configured page from the pool; the semaphore caps
+            # how many documents render concurrently so heavy pipelines don't
+            # overload Chromium
+            async with self._semaphore:
+                page = await self._page_pool.get()
+                healthy = True
+                try:
+                    # Load HTML content; domcontentloaded avoids networkidle's
+                    # fixed idle window, which is pure waiting for inlined HTML
+                    logger.info("Loading HTML content into async browser")
+                    await page.set_content(rendered_template.html_content, wait_until="domcontentloaded", timeout=config.timeout)
+
+                    # Wait for fonts deterministically instead of a fixed delay
+                    if config.wait_for_fonts > 0:
+                        logger.debug("Waiting for document fonts to be ready")
+                        await page.evaluate(
+                            "() => document.fonts ? document.fonts.ready : Promise.resolve()"
+                        )
+
+                    # Generate PDF
+                    logger.info(f"Generating PDF: {final_output_path}")
+                    pdf_options = self._build_pdf_options(config, rendered_template)
+
+                    pdf_bytes = await page.pdf(**pdf_options)
+                except Exception:
+                    healthy = False
+                    raise
+                finally:
+                    await self._return_page(page, healthy)
+
+            # Write PDF to file only when the caller asked for one; aiofiles
+            # keeps the event loop free to render other documents meanwhile
+            if final_output_path is not None:
+                async with aiofiles.open(final_output_path, 'wb') as f:
+                    await f.write(pdf_bytes)
+
             generation_time = __import__('time').time() - start_time
-            file_size = final_output_path.stat().st_size
-            
+            file_size = len(pdf_bytes)
+
             logger.info(f"Async PDF generated successfully: {file_size} bytes in {generation_time:.2f}s")
-            
+
             # Create result object
             generated_pdf = GeneratedPDF(
                 pdf_path=final_output_path,
                 file_size=file_size,
                 generation_time=generation_time,
+                pdf_bytes=pdf_bytes if final_output_path is None else None,
                 metadata={
                     'template_name': rendered_template.template_name,
                     'original_title': rendered_template.metadata.get('title'),
@@ -194,38 +322,88 @@ class AsyncPDFGenerator:
         except Exception as e:
             logger.error(f"Async PDF generation failed: {e}")
             # Clean up partial file
-            if final_output_path.exists():
+            if final_output_path is not None and final_output_path.exists():
                 final_output_path.unlink()
             raise RuntimeError(f"Async PDF generation failed: {e}")
             
+    async def generate_pdf_batch(
+        self,
+        rendered_templates,
+        pdf_config: Optional[PDFConfig] = None
+    ):
+        """
+        Generate PDFs for several templates on one long-lived page.
+
+        The page is borrowed once for the whole batch, so the per-document
+        cost is just set_content + pdf() — no page construction or teardown
+        between documents. Results are yielded as they complete so callers
+        can stream them.
+
+        Args:
+            rendered_templates: Iterable of RenderedTemplate objects
+            pdf_config: PDF generation configuration applied to every document
+
+        Yields:
+            GeneratedPDF objects with pdf_bytes held in memory
+
+        Raises:
+            RuntimeError: If browser is not started or PDF generation fails
+        """
+        if self.context is None:
+            raise RuntimeError("Async browser not started. Use async context manager or call _start_browser()")
+
+        config = pdf_config or PDFConfig()
+
+        async with self._semaphore:
+            page = await self._page_pool.get()
+            healthy = True
+            try:
+                for rendered_template in rendered_templates:
+                    start_time = __import__('time').time()
+
+                    await page.set_content(rendered_template.html_content, wait_until="domcontentloaded", timeout=config.timeout)
+                    if config.wait_for_fonts > 0:
+                        await page.evaluate(
+                            "() => document.fonts ? document.fonts.ready : Promise.resolve()"
+                        )
+
+                    pdf_options = self._build_pdf_options(config, rendered_template)
+                    pdf_bytes = await page.pdf(**pdf_options)
+
+                    generation_time = __import__('time').time() - start_time
+
+                    yield GeneratedPDF(
+                        pdf_path=None,
+                        file_size=len(pdf_bytes),
+                        generation_time=generation_time,
+                        pdf_bytes=pdf_bytes,
+                        metadata={
+                            'template_name': rendered_template.template_name,
+                            'original_title': rendered_template.metadata.get('title'),
+                            'brand': rendered_template.metadata.get('brand'),
+                            'word_count': rendered_template.metadata.get('word_count'),
+                            'config': config.__dict__
+                        }
+                    )
+            except Exception:
+                healthy = False
+                raise
+            finally:
+                await self._return_page(page, healthy)
+
     async def _configure_page_for_pdf(self, page: Page) -> None:
         """
         Configure page settings optimized for PDF generation.
-        
+
+        The static PDF styles are injected by the context init script; only
+        per-page state is configured here.
+
         Args:
             page: Playwright page instance
         """
         # Set media type to print for CSS @media print rules
         await page.emulate_media(media="print")
         
-        # Add custom styles for better PDF rendering
-        await page.add_style_tag(content="""
-            @page {
-                -webkit-print-color-adjust: exact;
-                color-adjust: exact;
-            }
-            
-            body {
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }
-            
-            * {
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }
-        """)
-        
     def _build_pdf_options(self, config: PDFConfig, rendered_template: RenderedTemplate) -> Dict[str, Any]:
         """
         Build PDF options dictionary from config and template.
@@ -5,21 +5,110 @@ Handles loading brand configurations, validating assets, and generating CSS vari
 for template processing.
 """
 
+import copy
+import errno
+import functools
 import json
 import logging
+import os
+import pickle
+import re
 import shutil
 import tarfile
 import hashlib
-import base64
+import binascii
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Tuple
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from typing import Dict, Any, Callable, Optional, List, Union, Tuple
+from dataclasses import dataclass, field, asdict, InitVar
+from datetime import datetime, timezone
 
 import yaml
 
+try:
+    from blake3 import blake3 as _checksum_hash
+except ImportError:
+    # BLAKE2b is the fastest hash shipped with the stdlib; BLAKE3 adds
+    # SIMD and multi-threading on top when the optional wheel is present
+    def _checksum_hash(data: bytes = b'') -> "hashlib._Hash":
+        return hashlib.blake2b(data, digest_size=32)
+
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C loader/dumper when PyYAML was built against it;
+# scanning and tokenization then run in C, which is several times faster
+# than the pure-Python implementation on every config read/write
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+try:
+    import fcntl
+    # FICLONE ioctl: ask the filesystem to share extents instead of
+    # copying bytes (btrfs, XFS with reflink=1). Linux-only.
+    _FICLONE = 0x40049409
+except ImportError:  # pragma: no cover - non-Linux platforms
+    fcntl = None
+    _FICLONE = None
+
+
+def _reflink_copy2(src, dst, *, follow_symlinks=True):
+    """
+    shutil.copy2 drop-in that clones file extents when the filesystem
+    supports reflinks, making copies O(1) in data moved. Falls back to a
+    regular copy on unsupported filesystems or platforms.
+    """
+    if fcntl is not None and follow_symlinks:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Cross-device, unsupported FS, etc. — clean up and copy bytes
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+# Directory-safe brand names: leading letter, then letters, digits,
+# underscore or hyphen, 50 chars max. A compiled regex replaces the
+# per-call chain of replace()/isalnum()/startswith() checks.
+_BRAND_NAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_-]{0,49}$')
+
+# Extension -> broad asset kind, for template asset classification
+_EXT_KIND = {
+    '.png': 'image', '.jpg': 'image', '.jpeg': 'image', '.svg': 'image',
+    '.woff': 'font', '.woff2': 'font', '.ttf': 'font', '.otf': 'font',
+    '.css': 'css',
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, caching repeats across brand loads."""
+    return datetime.fromisoformat(value)
+
+
+def _walk(root: Union[str, Path]):
+    """
+    Yield DirEntry objects for everything under root, depth-first.
+
+    os.scandir caches file type and stat results on each entry, so
+    traversals cost roughly half the syscalls of Path.rglob followed by
+    per-path is_file()/stat() calls.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                yield entry
+
 
 class BrandManagerError(Exception):
     """Base exception for brand management operations."""
@@ -106,9 +195,6 @@ class BrandConfig:
     # Brand metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    # Generated CSS variables
-    css_variables: str = ""
-    
     # Brand directory path
     brand_path: Path = field(default_factory=Path)
     
@@ -126,6 +212,34 @@ class BrandConfig:
     protected_at: Optional[datetime] = None
     protection_reason: str = ""
 
+    # Lazy CSS generation: load_brand installs a generator and the string
+    # is built on first .css_variables access, so callers that only read
+    # config metadata never pay for it. The InitVar keeps css_variables=
+    # accepted as a constructor argument for pre-built CSS.
+    _css_generator: Optional[Callable[["BrandConfig"], str]] = field(
+        default=None, repr=False, compare=False)
+    _generated_css: Optional[str] = field(default=None, repr=False, compare=False)
+    css_variables: InitVar[Optional[str]] = None
+
+    def __post_init__(self, css_variables: Optional[str] = None):
+        if css_variables:
+            self._generated_css = css_variables
+
+
+def _brand_config_css_get(self: BrandConfig) -> str:
+    """Generated CSS custom properties (built lazily on first access)."""
+    if self._generated_css is None:
+        generator = self._css_generator
+        self._generated_css = generator(self) if generator is not None else ""
+    return self._generated_css
+
+
+def _brand_config_css_set(self: BrandConfig, value: str) -> None:
+    self._generated_css = value
+
+
+BrandConfig.css_variables = property(_brand_config_css_get, _brand_config_css_set)
+
 
 class BrandManager:
     """
@@ -140,7 +254,14 @@ class BrandManager:
     - Asset management and integrity validation
     - Template system for brand inheritance
     """
-    
+
+    # Upper bound on cached parsed configs; evicted least-recently-used
+    _RAW_CACHE_MAX = 128
+
+    # Translation table for snake_case config keys to kebab-case CSS names;
+    # str.translate is a single C-level pass, unlike chained .replace calls
+    _KEBAB = str.maketrans({'_': '-'})
+
     def __init__(self, brands_root: Optional[Path] = None, templates_root: Optional[Path] = None, storage=None):
         """
         Initialize the BrandManager.
@@ -156,7 +277,22 @@ class BrandManager:
         self.brands_root = brands_root or Path("config/brands")
         self.templates_root = templates_root or Path("config/templates")
         self.storage = storage  # Store for future extensibility
-        
+
+        # Parsed-config cache keyed on (path, mtime_ns, size); the same brand
+        # is typically loaded many times per run and YAML parsing dominates
+        self._raw_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
+        # Generated-CSS cache keyed on a digest of the inputs; identical
+        # color/typography/layout sections across loads reuse the string
+        self._css_cache: Dict[str, str] = {}
+
+        # Compiled per-schema CSS emitters (see _build_css_generator)
+        self._css_gen: Dict[Tuple, Any] = {}
+
+        # Parsed template configs keyed by path; entries carry the source
+        # file's (mtime_ns, size) so edits invalidate automatically
+        self._template_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
         # Create directories if they don't exist
         self.brands_root.mkdir(parents=True, exist_ok=True)
         self.templates_root.mkdir(parents=True, exist_ok=True)
@@ -182,9 +318,8 @@ class BrandManager:
             raise BrandNotFoundError(f"Brand configuration not found: {config_path}")
             
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f)
-                
+            raw_config = self._load_raw_config(config_path)
+
             if not raw_config:
                 raise BrandValidationError("Empty brand configuration")
                 
@@ -207,19 +342,19 @@ class BrandManager:
             
             if metadata.get('created_at'):
                 try:
-                    created_at = datetime.fromisoformat(metadata['created_at'])
+                    created_at = _parse_iso(metadata['created_at'])
                 except (ValueError, TypeError):
                     logger.warning(f"Invalid created_at timestamp in {brand_name}")
                     
             if metadata.get('updated_at'):
                 try:
-                    updated_at = datetime.fromisoformat(metadata['updated_at'])
+                    updated_at = _parse_iso(metadata['updated_at'])
                 except (ValueError, TypeError):
                     logger.warning(f"Invalid updated_at timestamp in {brand_name}")
                     
             if raw_config.get('protected_at'):
                 try:
-                    protected_at = datetime.fromisoformat(raw_config['protected_at'])
+                    protected_at = _parse_iso(raw_config['protected_at'])
                 except (ValueError, TypeError):
                     logger.warning(f"Invalid protected_at timestamp in {brand_name}")
             
@@ -255,8 +390,8 @@ class BrandManager:
             # Validate assets and update paths
             self._validate_assets(brand_config)
             
-            # Generate CSS variables
-            brand_config.css_variables = self._generate_css_variables(brand_config)
+            # CSS variables are generated lazily on first access
+            brand_config._css_generator = self._generate_css_variables
             
             logger.info(f"Successfully loaded brand: {brand_config.name}")
             return brand_config
@@ -276,50 +411,70 @@ class BrandManager:
             brand_config: BrandConfig object to validate and update
         """
         validated_assets = {}
-        
+
+        # Paths stay plain strings throughout: os.path.join avoids the
+        # Path-object construction and normalization cost per asset
+        brand_root = str(brand_config.brand_path)
+
+        # Existence checks are batched per parent directory: one scandir
+        # listing replaces a stat syscall per asset
+        dir_listing_cache: Dict[str, set] = {}
+
+        def _exists(full_path: str) -> bool:
+            parent = os.path.dirname(full_path)
+            present = dir_listing_cache.get(parent)
+            if present is None:
+                try:
+                    with os.scandir(parent) as it:
+                        present = {entry.name for entry in it}
+                except OSError:
+                    present = set()
+                dir_listing_cache[parent] = present
+            return os.path.basename(full_path) in present
+
         for asset_key, asset_value in brand_config.assets.items():
             if not asset_value:
                 logger.warning(f"Empty asset path for {asset_key}")
                 continue
-                
+
             # Handle font list (special case)
             if asset_key == 'fonts' and isinstance(asset_value, list):
                 validated_fonts = []
                 for font_path in asset_value:
                     if not font_path:
                         continue
-                        
-                    if not Path(font_path).is_absolute():
-                        full_path = brand_config.brand_path / font_path
+
+                    if not os.path.isabs(font_path):
+                        full_path = os.path.join(brand_root, font_path)
                     else:
-                        full_path = Path(font_path)
-                        
-                    if full_path.exists():
-                        validated_fonts.append(str(full_path))
+                        full_path = font_path
+
+                    if _exists(full_path):
+                        validated_fonts.append(full_path)
                         logger.debug(f"Validated font: {full_path}")
                     else:
                         logger.warning(f"Font not found: {full_path}")
-                        validated_fonts.append(str(full_path))  # Graceful degradation
-                        
+                        validated_fonts.append(full_path)  # Graceful degradation
+
                 validated_assets[asset_key] = validated_fonts
             else:
                 # Handle single asset path
                 asset_path = str(asset_value)  # Ensure it's a string
-                
+
                 # Convert relative path to absolute path within brand directory
-                if not Path(asset_path).is_absolute():
-                    full_path = brand_config.brand_path / asset_path
+                if not os.path.isabs(asset_path):
+                    full_path = os.path.join(brand_root, asset_path)
                 else:
-                    full_path = Path(asset_path)
-                    
-                if full_path.exists():
-                    validated_assets[asset_key] = str(full_path)
+                    full_path = asset_path
+
+                if _exists(full_path):
+                    validated_assets[asset_key] = full_path
                     logger.debug(f"Validated asset {asset_key}: {full_path}")
                 else:
                     logger.warning(f"Asset not found {asset_key}: {full_path}")
                     # Include path anyway for graceful degradation
-                    validated_assets[asset_key] = str(full_path)
-            
+                    validated_assets[asset_key] = full_path
+
         brand_config.assets = validated_assets
         
     def _generate_css_variables(self, brand_config: BrandConfig) -> str:
@@ -332,40 +487,98 @@ class BrandManager:
         Returns:
             CSS string with custom properties
         """
-        css_lines = [":root {"]
-        
-        # Generate color variables
-        for color_name, color_value in brand_config.colors.items():
-            css_name = color_name.replace('_', '-')
-            css_lines.append(f"  --color-{css_name}: {color_value};")
-            
-        # Generate typography variables
+        # BLAKE2b over the repr of the three input sections is cheap (the
+        # dicts are small) and lets repeated loads of an unchanged brand
+        # skip the string building below entirely
+        cache_key = hashlib.blake2b(
+            repr((brand_config.colors, brand_config.typography,
+                  brand_config.layout)).encode('utf-8'),
+            digest_size=16,
+        ).hexdigest()
+        cached = self._css_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        colors = brand_config.colors
         typography = brand_config.typography
-        if 'primary_font' in typography:
-            css_lines.append(f"  --font-primary: '{typography['primary_font']}', {typography.get('fallback', 'sans-serif')};")
-        if 'secondary_font' in typography:
-            css_lines.append(f"  --font-secondary: '{typography['secondary_font']}', {typography.get('fallback', 'sans-serif')};")
-            
-        # Generate font size variables
-        if 'sizes' in typography:
-            for size_name, size_value in typography['sizes'].items():
-                css_name = size_name.replace('_', '-')
-                css_lines.append(f"  --font-size-{css_name}: {size_value};")
-                
-        # Generate font weight variables  
-        if 'weights' in typography:
-            for weight_name, weight_value in typography['weights'].items():
-                css_name = weight_name.replace('_', '-')
-                css_lines.append(f"  --font-weight-{css_name}: {weight_value};")
-                
-        # Generate layout variables
-        for layout_name, layout_value in brand_config.layout.items():
-            css_name = layout_name.replace('_', '-')
-            css_lines.append(f"  --layout-{css_name}: {layout_value};")
-            
-        css_lines.append("}")
-        
-        return "\n".join(css_lines)
+        layout = brand_config.layout
+
+        # Brands in a deployment share a handful of config schemas, so the
+        # emitter function is specialized per schema (set of variable names)
+        # and reused whenever only the values differ
+        signature = (
+            tuple(colors),
+            'primary_font' in typography,
+            'secondary_font' in typography,
+            tuple(typography.get('sizes', ())),
+            tuple(typography.get('weights', ())),
+            tuple(layout),
+        )
+        generator = self._css_gen.get(signature)
+        if generator is None:
+            generator = self._build_css_generator(signature)
+            self._css_gen[signature] = generator
+
+        css = generator(colors, typography, layout)
+        self._css_cache[cache_key] = css
+        return css
+
+    def _build_css_generator(self, signature: Tuple) -> "Callable[[Dict, Dict, Dict], str]":
+        """
+        Compile a CSS emitter specialized to one config schema.
+
+        Variable names are baked into a single %-template at build time,
+        leaving only value lookups and one format call per invocation.
+        Keys are embedded via repr() and template text is %-escaped, so
+        arbitrary config keys cannot break out of the generated source.
+        """
+        color_keys, has_primary, has_secondary, size_keys, weight_keys, layout_keys = signature
+        kebab = self._KEBAB
+
+        def esc(text: str) -> str:
+            return text.replace('%', '%%')
+
+        lines = [":root {"]
+        exprs: List[str] = []
+
+        for key in color_keys:
+            lines.append("  --color-%s: %%s;" % esc(key.translate(kebab)))
+            exprs.append("colors[%r]" % key)
+
+        if has_primary:
+            lines.append("  --font-primary: '%s', %s;")
+            exprs.append("typography['primary_font']")
+            exprs.append("typography.get('fallback', 'sans-serif')")
+        if has_secondary:
+            lines.append("  --font-secondary: '%s', %s;")
+            exprs.append("typography['secondary_font']")
+            exprs.append("typography.get('fallback', 'sans-serif')")
+
+        for key in size_keys:
+            lines.append("  --font-size-%s: %%s;" % esc(key.translate(kebab)))
+            exprs.append("typography['sizes'][%r]" % key)
+
+        for key in weight_keys:
+            lines.append("  --font-weight-%s: %%s;" % esc(key.translate(kebab)))
+            exprs.append("typography['weights'][%r]" % key)
+
+        for key in layout_keys:
+            lines.append("  --layout-%s: %%s;" % esc(key.translate(kebab)))
+            exprs.append("layout[%r]" % key)
+
+        lines.append("}")
+        template = "\n".join(lines)
+
+        if not exprs:
+            return lambda colors, typography, layout: template
+
+        source = (
+            "def _css(colors, typography, layout):\n"
+            "    return _template %% (%s,)" % ", ".join(exprs)
+        )
+        namespace = {'_template': template}
+        exec(compile(source, '<brand_css_gen>', 'exec'), namespace)
+        return namespace['_css']
         
     def list_available_brands(self) -> List[str]:
         """
@@ -437,18 +650,20 @@ class BrandManager:
                 source_config_path = source_brand_path / "brand_config.yaml"
                 if source_config_path.exists():
                     with open(source_config_path, 'r', encoding='utf-8') as f:
-                        brand_config = yaml.safe_load(f)
+                        brand_config = yaml.load(f, Loader=_YamlLoader)
                     template_used = copy_from
                 
                 # Copy assets directory
                 source_assets = source_brand_path / "assets"
                 if source_assets.exists():
-                    shutil.copytree(source_assets, brand_path / "assets", dirs_exist_ok=True)
+                    shutil.copytree(source_assets, brand_path / "assets",
+                                    dirs_exist_ok=True, copy_function=_reflink_copy2)
                 
                 # Copy templates directory  
                 source_templates = source_brand_path / "templates"
                 if source_templates.exists():
-                    shutil.copytree(source_templates, brand_path / "templates", dirs_exist_ok=True)
+                    shutil.copytree(source_templates, brand_path / "templates",
+                                    dirs_exist_ok=True, copy_function=_reflink_copy2)
                 
                 logger.info(f"Copied brand structure from '{copy_from}' to '{brand_name}'")
                 
@@ -497,16 +712,19 @@ class BrandManager:
                 
             # Save configuration
             config_path = brand_path / "brand_config.yaml"
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(brand_config, f, default_flow_style=False, sort_keys=False)
+            text = yaml.dump(brand_config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            config_path.write_bytes(text.encode('utf-8'))
+            self._invalidate_raw_config(config_path)
                 
             # Get list of created files
             created_files = []
-            for item in brand_path.rglob("*"):
-                if item.is_file():
-                    created_files.append(str(item.relative_to(brand_path)))
-                elif item.is_dir():
-                    created_files.append(str(item.relative_to(brand_path)) + "/")
+            root = str(brand_path)
+            for entry in _walk(brand_path):
+                rel = os.path.relpath(entry.path, root)
+                if entry.is_file(follow_symlinks=False):
+                    created_files.append(rel)
+                elif entry.is_dir(follow_symlinks=False):
+                    created_files.append(rel + "/")
                     
             logger.info(f"Successfully created brand: {brand_name}")
             
@@ -559,7 +777,7 @@ class BrandManager:
         try:
             # Load current configuration
             with open(config_path, 'r', encoding='utf-8') as f:
-                current_config = yaml.safe_load(f)
+                current_config = yaml.load(f, Loader=_YamlLoader)
                 
             backup_path = None
             if create_backup:
@@ -582,8 +800,9 @@ class BrandManager:
             validation_warnings = self._validate_config_structure(updated_config)
             
             # Save updated configuration
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(updated_config, f, default_flow_style=False, sort_keys=False)
+            text = yaml.dump(updated_config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            config_path.write_bytes(text.encode('utf-8'))
+            self._invalidate_raw_config(config_path)
                 
             logger.info(f"Successfully updated brand: {brand_name}")
             
@@ -632,25 +851,33 @@ class BrandManager:
             self._check_protection(brand_name, "delete")
             
         try:
-            # Get file information before deletion
+            # Get file information before deletion — a single scandir pass
+            # collects files, sizes and the directory count together
             deleted_files = []
             total_size = 0
-            for item in brand_path.rglob("*"):
-                if item.is_file():
-                    deleted_files.append(str(item))
-                    total_size += item.stat().st_size
-                    
+            dir_count = 0
+            for entry in _walk(brand_path):
+                if entry.is_dir(follow_symlinks=False):
+                    dir_count += 1
+                elif entry.is_file(follow_symlinks=False):
+                    deleted_files.append(entry.path)
+                    total_size += entry.stat().st_size
+
+
             backup_path = None
             if create_backup and not force:
                 # Create deletion backup
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = self.brands_root.parent / f"{brand_name}_deleted_{timestamp}.tar.gz"
                 
-                with tarfile.open(backup_path, "w:gz") as tar:
+                # Level 1 is several times faster than the default on the
+                # mostly-binary font/image payload, for little size cost
+                with tarfile.open(backup_path, "w:gz", compresslevel=1) as tar:
                     tar.add(brand_path, arcname=brand_name)
                     
             # Perform deletion
             shutil.rmtree(brand_path)
+            self._invalidate_raw_config(brand_path / "brand_config.yaml")
             
             logger.info(f"Successfully deleted brand: {brand_name}")
             
@@ -664,7 +891,7 @@ class BrandManager:
                 'backup_created': backup_path is not None,
                 'cleanup_summary': {
                     'files_deleted': len(deleted_files),
-                    'directories_removed': len([d for d in brand_path.rglob("*") if d.is_dir()]),
+                    'directories_removed': dir_count,
                     'total_size_deleted': total_size
                 }
             }
@@ -685,106 +912,260 @@ class BrandManager:
         Returns:
             Dict with brands list and metadata
         """
+        def _load_one(brand_dir: Path) -> Optional[Dict[str, Any]]:
+            config_path = brand_dir / "brand_config.yaml"
+            if not config_path.exists():
+                return None
+
+            try:
+                config = self._load_listing_metadata(config_path)
+
+                metadata = config.get('metadata', {})
+                status = metadata.get('status', 'active')
+
+                if status_filter and status != status_filter:
+                    return None
+
+                brand_info = {
+                    'name': brand_dir.name,
+                    'display_name': config.get('brand', {}).get('name', brand_dir.name),
+                    'status': status
+                }
+
+                if include_metadata:
+                    # Calculate asset statistics
+                    assets_dir = brand_dir / "assets"
+                    total_assets = 0
+                    total_size = 0
+
+                    if assets_dir.exists():
+                        for entry in _walk(assets_dir):
+                            if entry.is_file(follow_symlinks=False):
+                                total_assets += 1
+                                total_size += entry.stat().st_size
+
+                    brand_info.update({
+                        'template_source': metadata.get('template_source'),
+                        'created_at': metadata.get('created_at'),
+                        'updated_at': metadata.get('updated_at'),
+                        'version': metadata.get('version', '1.0.0'),
+                        'total_assets': total_assets,
+                        'total_size': total_size,
+                        'compliance_status': 'unknown'  # Would run validation
+                    })
+
+                return brand_info
+
+            except Exception as e:
+                logger.warning(f"Failed to load metadata for {brand_dir.name}: {e}")
+                return None
+
         try:
+            brand_dirs = [d for d in self.brands_root.iterdir() if d.is_dir()]
+
+            # Per-brand work is file I/O plus C-level YAML parsing, both of
+            # which release the GIL, so threads give near-linear speedup
             brands_list = []
-            
-            for brand_dir in self.brands_root.iterdir():
-                if not brand_dir.is_dir():
-                    continue
-                    
-                config_path = brand_dir / "brand_config.yaml"
-                if not config_path.exists():
-                    continue
-                    
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f)
-                        
-                    metadata = config.get('metadata', {})
-                    status = metadata.get('status', 'active')
-                    
-                    if status_filter and status != status_filter:
-                        continue
-                        
-                    brand_info = {
-                        'name': brand_dir.name,
-                        'display_name': config.get('brand', {}).get('name', brand_dir.name),
-                        'status': status
-                    }
-                    
-                    if include_metadata:
-                        # Calculate asset statistics
-                        assets_dir = brand_dir / "assets"
-                        total_assets = 0
-                        total_size = 0
-                        
-                        if assets_dir.exists():
-                            for asset in assets_dir.rglob("*"):
-                                if asset.is_file():
-                                    total_assets += 1
-                                    total_size += asset.stat().st_size
-                                    
-                        brand_info.update({
-                            'template_source': metadata.get('template_source'),
-                            'created_at': metadata.get('created_at'),
-                            'updated_at': metadata.get('updated_at'),
-                            'version': metadata.get('version', '1.0.0'),
-                            'total_assets': total_assets,
-                            'total_size': total_size,
-                            'compliance_status': 'unknown'  # Would run validation
-                        })
-                        
-                    brands_list.append(brand_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to load metadata for {brand_dir.name}: {e}")
-                    continue
-                    
+            available_statuses = set()
+            if brand_dirs:
+                with ThreadPoolExecutor(max_workers=min(32, len(brand_dirs))) as executor:
+                    # Collect statuses while gathering results instead of
+                    # re-scanning the finished list
+                    for brand_info in executor.map(_load_one, brand_dirs):
+                        if brand_info:
+                            brands_list.append(brand_info)
+                            available_statuses.add(brand_info['status'])
+
             # Sort by name
             brands_list.sort(key=lambda x: x['name'])
-            
+
             return {
                 'success': True,
                 'brands': brands_list,
                 'total_count': len(brands_list),
                 'status_filter': status_filter,
-                'available_statuses': list(set(b.get('status', 'active') for b in brands_list))
+                'available_statuses': list(available_statuses)
             }
             
         except Exception as e:
             logger.error(f"Failed to list brands: {e}")
             raise BrandManagerError(f"Failed to list brands: {e}")
     
+    def _load_raw_config(self, config_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Parse a brand YAML file, serving unchanged files from the in-process cache.
+
+        The cache key is (path, mtime_ns, size) so an edited file misses
+        automatically. Hits return a deep copy because callers mutate the
+        parsed dict (merges, metadata updates).
+
+        Cold loads go through a brand_config.pkl sidecar regenerated
+        whenever the YAML is newer: unpickling is orders of magnitude
+        faster than YAML parsing. The sidecar lives inside the brand
+        directory, which is trusted content (pickle is not safe against
+        hostile files) — brands_root is assumed to be operator-controlled.
+        """
+        st = config_path.stat()
+        key = (str(config_path), st.st_mtime_ns, st.st_size)
+
+        cached = self._raw_cache.get(key)
+        if cached is not None:
+            try:
+                self._raw_cache.move_to_end(key)
+            except KeyError:
+                # Concurrently evicted by another thread; the value is still good
+                pass
+            return copy.deepcopy(cached)
+
+        raw_config = self._load_pickle_sidecar(config_path, st)
+        if raw_config is None:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                raw_config = yaml.load(f, Loader=_YamlLoader)
+            if raw_config is not None:
+                self._write_pickle_sidecar(config_path, raw_config)
+
+        if raw_config is not None:
+            self._raw_cache[key] = copy.deepcopy(raw_config)
+            while len(self._raw_cache) > self._RAW_CACHE_MAX:
+                self._raw_cache.popitem(last=False)
+
+        return raw_config
+
+    def _load_config_sections(self, config_path: Path,
+                              sections: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Extract only the named root-level sections of a brand config.
+
+        The YAML is composed to a node graph (C-fast with libyaml) but
+        Python objects are only constructed for the requested root keys,
+        skipping the heavy sections. A cached full parse is used when one
+        is already in memory.
+        """
+        st = config_path.stat()
+        key = (str(config_path), st.st_mtime_ns, st.st_size)
+        cached = self._raw_cache.get(key)
+        if cached is not None:
+            return {k: copy.deepcopy(cached[k])
+                    for k in sections if k in cached}
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            loader = _YamlLoader(f)
+            try:
+                node = loader.get_single_node()
+                result: Dict[str, Any] = {}
+                if isinstance(node, yaml.MappingNode):
+                    for key_node, value_node in node.value:
+                        section = loader.construct_object(key_node, deep=True)
+                        if section in sections:
+                            result[section] = loader.construct_object(value_node, deep=True)
+                return result
+            finally:
+                loader.dispose()
+
+    def _load_listing_metadata(self, config_path: Path) -> Dict[str, Any]:
+        """
+        Extract only the 'brand' and 'metadata' sections of a brand config.
+
+        Listing does not need colors/typography/assets, which are the bulk
+        of the file.
+        """
+        return self._load_config_sections(config_path, ('brand', 'metadata'))
+
+    _PROTECTION_KEYS = ('is_protected', 'protection_level', 'protection_reason',
+                        'protected_by', 'protected_at')
+
+    def _load_protection_only(self, brand_name: str) -> Dict[str, Any]:
+        """
+        Read just the protection fields of a brand config.
+
+        Protection is checked on every update/delete, so parsing the whole
+        YAML (and validating assets) for four scalar fields is wasted work.
+
+        Raises:
+            BrandNotFoundError: If the brand configuration doesn't exist
+        """
+        config_path = self.brands_root / brand_name / "brand_config.yaml"
+        try:
+            return self._load_config_sections(config_path, self._PROTECTION_KEYS)
+        except FileNotFoundError:
+            raise BrandNotFoundError(f"Brand configuration not found: {config_path}")
+
+    def _load_pickle_sidecar(self, config_path: Path,
+                             st: "os.stat_result") -> Optional[Dict[str, Any]]:
+        """Load the .pkl sidecar if it is at least as new as the YAML file."""
+        pkl_path = config_path.with_suffix('.pkl')
+        try:
+            if pkl_path.stat().st_mtime_ns >= st.st_mtime_ns:
+                with open(pkl_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        return None
+
+    def _write_pickle_sidecar(self, config_path: Path, raw_config: Dict[str, Any]) -> None:
+        """Write the .pkl sidecar; failures are non-fatal (read-only dirs)."""
+        pkl_path = config_path.with_suffix('.pkl')
+        try:
+            with open(pkl_path, 'wb') as f:
+                pickle.dump(raw_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write config sidecar {pkl_path}: {e}")
+
+    def _invalidate_raw_config(self, config_path: Path) -> None:
+        """Drop any cached parse of the given config file, including its sidecar."""
+        path_str = str(config_path)
+        for key in [k for k in self._raw_cache if k[0] == path_str]:
+            del self._raw_cache[key]
+        try:
+            config_path.with_suffix('.pkl').unlink()
+        except OSError:
+            pass
+
     def _is_valid_brand_name(self, name: str) -> bool:
         """Validate brand name for directory/file safety."""
-        if not name or len(name) > 50:
-            return False
-        if not name.replace('_', '').replace('-', '').isalnum():
-            return False
-        if name.startswith(('.', '_')) or name[0].isdigit():
-            return False
-        return True
+        return _BRAND_NAME_RE.match(name) is not None
         
     def _load_template(self, template_name: str) -> Dict[str, Any]:
         """Load template configuration."""
         template_path = self.templates_root / template_name / "template_config.yaml"
-        if not template_path.exists():
+        try:
+            st = template_path.stat()
+        except FileNotFoundError:
             raise BrandValidationError(f"Template '{template_name}' not found")
-            
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+
+        # Templates rarely change; serve unchanged files from the cache
+        # (deep-copied because callers merge into the result)
+        cache_key = str(template_path)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+
+        # One read of the whole file; libyaml scans bytes directly
+        # without the text-stream read loop
+        config = yaml.load(template_path.read_bytes(), Loader=_YamlLoader)
+        if config is not None:
+            self._template_cache[cache_key] = (st.st_mtime_ns, st.st_size,
+                                               copy.deepcopy(config))
+        return config
             
     def _merge_configs(self, base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge configuration dictionaries."""
-        result = base.copy()
-        
-        for key, value in updates.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-                
-        return result
+        """
+        Deep-merge updates into base and return base.
+
+        Merges in place: callers always pass a freshly parsed or copied
+        dict and use the return value. The explicit stack avoids per-level
+        Python call frames on nested configs.
+        """
+        stack = [(base, updates)]
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                existing = target.get(key)
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
+        return base
         
     def _create_backup(self, brand_name: str, config: Dict[str, Any]) -> Path:
         """Create backup of current brand configuration."""
@@ -795,9 +1176,13 @@ class BrandManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backups_dir / f"backup_{timestamp}.yaml"
         
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            
+        # Serialize first, then one write to a temp file swapped in with
+        # os.replace so a crash never leaves a partial backup behind
+        text = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        tmp_path = backup_path.with_suffix('.yaml.tmp')
+        tmp_path.write_bytes(text.encode('utf-8'))
+        os.replace(tmp_path, backup_path)
+
         return backup_path
         
     def _has_major_changes(self, updates: Dict[str, Any]) -> bool:
@@ -876,27 +1261,28 @@ class BrandManager:
             BrandProtectionError: If brand is protected and operation is not allowed
         """
         try:
-            config = self.load_brand(brand_name)
-            
+            # Partial parse: only the protection fields are needed here
+            config = self._load_protection_only(brand_name)
+
             # Check if brand is protected
-            if not config.is_protected:
+            if not config.get('is_protected', False):
                 return  # Not protected, allow operation
-                
-            protection_level = config.protection_level
-            protected_reason = config.protection_reason or "Brand is marked as protected"
-            
+
+            protection_level = config.get('protection_level', 'none')
+            protected_reason = config.get('protection_reason') or "Brand is marked as protected"
+
             if protection_level == "strict":
                 # Strict protection - block all modifications
                 raise BrandProtectionError(
                     f"Cannot {operation} protected brand '{brand_name}': {protected_reason}. "
-                    f"Protected by: {config.protected_by or 'system'} on {config.protected_at or 'unknown date'}. "
+                    f"Protected by: {config.get('protected_by') or 'system'} on {config.get('protected_at') or 'unknown date'}. "
                     "Use force=True to override (admin only)."
                 )
             elif protection_level == "warn":
                 # Warning protection - log but allow
                 logger.warning(
                     f"Attempting to {operation} protected brand '{brand_name}': {protected_reason}. "
-                    f"Protected by: {config.protected_by or 'system'}"
+                    f"Protected by: {config.get('protected_by') or 'system'}"
                 )
             # "none" protection level allows all operations
                 
@@ -1035,8 +1421,12 @@ class AssetManager:
     ALLOWED_IMAGE_TYPES = {'.png', '.jpg', '.jpeg', '.svg', '.gif'}
     ALLOWED_FONT_TYPES = {'.woff', '.woff2', '.ttf', '.otf', '.eot'}
     ALLOWED_OTHER_TYPES = {'.css', '.js', '.html'}
+    _ALLOWED_ALL_TYPES = frozenset(ALLOWED_IMAGE_TYPES | ALLOWED_FONT_TYPES | ALLOWED_OTHER_TYPES)
     
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    _B64_CHUNK = 1 << 20  # base64 chars per decode chunk; multiple of 4
+    _B64_ALPHABET = (b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                     b'abcdefghijklmnopqrstuvwxyz0123456789+/=')
     
     def __init__(self, brand_manager: BrandManager):
         """
@@ -1046,18 +1436,25 @@ class AssetManager:
             brand_manager: BrandManager instance for accessing brand paths
         """
         self.brand_manager = brand_manager
-        
-    def upload_asset(self, brand_name: str, asset_data: str, filename: str, 
-                    asset_type: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # Per-brand asset registries, loaded once and written back on
+        # mutation; the dirty set tracks which ones still need a flush
+        self._registry_cache: Dict[str, Dict[str, Any]] = {}
+        self._registry_dirty: set = set()
+
+    def upload_asset(self, brand_name: str, asset_data: str, filename: str,
+                    asset_type: str, metadata: Optional[Dict[str, Any]] = None,
+                    _now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Upload an asset to a brand directory.
-        
+
         Args:
             brand_name: Name of target brand
             asset_data: Base64 encoded file data
             filename: Original filename
             asset_type: Type of asset ('logo', 'font', 'css', etc.)
             metadata: Additional metadata for the asset
+            _now: Upload timestamp; batch callers can compute one
+                datetime.now() and reuse it across many uploads
             
         Returns:
             Dict with upload result details
@@ -1079,15 +1476,31 @@ class AssetManager:
             if len(asset_data) > self.MAX_FILE_SIZE * 2:  # Base64 is ~1.33x larger
                 raise BrandValidationError(f"Base64 data too large: {len(asset_data)} chars")
                 
-            # Decode and validate asset data with error handling
+            # Validate once with C-level primitives, then decode in chunks
+            # (multiples of 4 chars) so an oversized payload is rejected as
+            # soon as the cap is crossed instead of after materialising the
+            # whole decoded blob
             try:
-                file_data = base64.b64decode(asset_data, validate=True)
+                raw = asset_data.encode('ascii')
+                cleaned = raw.translate(None, b' \n\r\t')
+                if len(cleaned) % 4 or cleaned.translate(None, self._B64_ALPHABET):
+                    raise binascii.Error('Invalid base64-encoded string')
+
+                decoded_chunks = []
+                decoded_size = 0
+                for offset in range(0, len(cleaned), self._B64_CHUNK):
+                    chunk = binascii.a2b_base64(cleaned[offset:offset + self._B64_CHUNK])
+                    decoded_size += len(chunk)
+                    if decoded_size > self.MAX_FILE_SIZE:
+                        raise BrandValidationError(
+                            f"File too large: {decoded_size} bytes > {self.MAX_FILE_SIZE}"
+                        )
+                    decoded_chunks.append(chunk)
+                file_data = b''.join(decoded_chunks)
+            except BrandValidationError:
+                raise
             except Exception as e:
                 raise BrandValidationError(f"Invalid base64 data: {str(e)}")
-            
-            # Validate decoded file size
-            if len(file_data) > self.MAX_FILE_SIZE:
-                raise BrandValidationError(f"File too large: {len(file_data)} bytes > {self.MAX_FILE_SIZE}")
                 
             # Validate minimum file size (prevent empty files)
             if len(file_data) == 0:
@@ -1112,12 +1525,16 @@ class AssetManager:
                 filename = self._generate_unique_filename(target_dir, filename)
                 target_path = target_dir / filename
                 
-            # Calculate checksum
-            checksum = hashlib.sha256(file_data).hexdigest()
-            
-            # Write file
+            # Write and checksum in one pass over the decoded bytes so the
+            # data is only walked once while it is hot in cache
+            hasher = _checksum_hash()
+            view = memoryview(file_data)
             with open(target_path, 'wb') as f:
-                f.write(file_data)
+                for offset in range(0, len(view), 1 << 20):
+                    block = view[offset:offset + (1 << 20)]
+                    hasher.update(block)
+                    f.write(block)
+            checksum = hasher.hexdigest()
                 
             # Create asset metadata
             asset_record = BrandAsset(
@@ -1125,7 +1542,7 @@ class AssetManager:
                 asset_type=asset_type,
                 file_size=len(file_data),
                 checksum=checksum,
-                uploaded_at=datetime.now(),
+                uploaded_at=_now or datetime.now(),
                 metadata=metadata or {}
             )
             
@@ -1162,26 +1579,30 @@ class AssetManager:
         """
         brand_path = self.brand_manager.brands_root / brand_name
         full_asset_path = brand_path / asset_path
-        
-        if not full_asset_path.exists():
+
+        # A single stat covers both the existence check and the metadata
+        # read below; exists() would issue the same syscall twice
+        try:
+            stat = full_asset_path.stat()
+        except FileNotFoundError:
             return {
                 'success': False,
                 'asset_path': asset_path,
                 'status': 'missing',
                 'message': 'Asset file not found'
             }
-            
+
         try:
-            # Check file integrity
+            # Hash in fixed-size chunks so large assets never sit fully in
+            # memory; the file size comes from the stat above
+            hasher = _checksum_hash()
             with open(full_asset_path, 'rb') as f:
-                file_data = f.read()
-                
-            checksum = hashlib.sha256(file_data).hexdigest()
-            file_size = len(file_data)
-            
-            # Get file stats
-            stat = full_asset_path.stat()
-            
+                while chunk := f.read(65536):
+                    hasher.update(chunk)
+
+            checksum = hasher.hexdigest()
+            file_size = stat.st_size
+
             # Validate file type
             file_ext = full_asset_path.suffix.lower()
             is_allowed_type = self._is_allowed_file_type(file_ext)
@@ -1192,7 +1613,7 @@ class AssetManager:
                 'status': 'valid' if is_allowed_type else 'invalid_type',
                 'file_size': file_size,
                 'checksum': checksum,
-                'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'modified_time': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
                 'is_allowed_type': is_allowed_type,
                 'file_extension': file_ext,
                 'message': 'Asset validation completed'
@@ -1223,58 +1644,62 @@ class AssetManager:
             raise BrandNotFoundError(f"Brand '{brand_name}' not found")
             
         assets_dir = brand_path / "assets"
-        if not assets_dir.exists():
-            return {
-                'success': True,
-                'brand_name': brand_name,
-                'assets': [],
-                'total_count': 0,
-                'total_size': 0
-            }
-            
+
         try:
             assets_list = []
             total_size = 0
-            
-            for asset_path in assets_dir.rglob("*"):
-                if asset_path.is_file():
+            prefix_len = len(str(assets_dir)) + 1
+
+            # Plain-string path handling: pathlib construction per entry is
+            # measurably slower than os.path on large asset trees
+            for entry in _walk(assets_dir):
+                if entry.is_file(follow_symlinks=False):
                     # Determine asset type from directory structure
-                    relative_path = asset_path.relative_to(assets_dir)
+                    relative_path = entry.path[prefix_len:]
                     inferred_type = self._infer_asset_type(relative_path)
-                    
+
                     # Filter by asset type if specified
                     if asset_type and inferred_type != asset_type:
                         continue
-                        
-                    # Get file stats
-                    stat = asset_path.stat()
+
+                    # Get file stats (cached on the DirEntry)
+                    stat = entry.stat()
                     file_size = stat.st_size
                     total_size += file_size
-                    
+
                     assets_list.append({
-                        'filename': asset_path.name,
-                        'relative_path': str(relative_path),
+                        'filename': entry.name,
+                        'relative_path': relative_path,
                         'asset_type': inferred_type,
                         'file_size': file_size,
-                        'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'file_extension': asset_path.suffix.lower()
+                        'modified_time': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
+                        'file_extension': os.path.splitext(entry.name)[1].lower()
                     })
-                    
+
             # Sort by filename
             assets_list.sort(key=lambda x: x['filename'])
-            
+
+        except FileNotFoundError:
+            # No assets directory yet
             return {
                 'success': True,
                 'brand_name': brand_name,
-                'assets': assets_list,
-                'total_count': len(assets_list),
-                'total_size': total_size,
-                'asset_type_filter': asset_type
+                'assets': [],
+                'total_count': 0,
+                'total_size': 0
             }
-            
         except Exception as e:
             logger.error(f"Failed to list assets for brand {brand_name}: {e}")
             raise BrandManagerError(f"Failed to list assets: {e}")
+
+        return {
+            'success': True,
+            'brand_name': brand_name,
+            'assets': assets_list,
+            'total_count': len(assets_list),
+            'total_size': total_size,
+            'asset_type_filter': asset_type
+        }
             
     def delete_asset(self, brand_name: str, asset_path: str, 
                     create_backup: bool = True) -> Dict[str, Any]:
@@ -1291,13 +1716,14 @@ class AssetManager:
         """
         brand_path = self.brand_manager.brands_root / brand_name
         full_asset_path = brand_path / asset_path
-        
-        if not full_asset_path.exists():
-            raise BrandValidationError(f"Asset not found: {asset_path}")
-            
+
+        # Get file info before deletion; the stat doubles as the existence check
         try:
-            # Get file info before deletion
             stat = full_asset_path.stat()
+        except FileNotFoundError:
+            raise BrandValidationError(f"Asset not found: {asset_path}")
+
+        try:
             file_size = stat.st_size
             
             backup_path = None
@@ -1305,15 +1731,25 @@ class AssetManager:
                 # Create backup
                 backups_dir = brand_path / "backups"
                 backups_dir.mkdir(exist_ok=True)
-                
+
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_filename = f"{full_asset_path.stem}_{timestamp}{full_asset_path.suffix}"
                 backup_path = backups_dir / backup_filename
-                
-                shutil.copy2(full_asset_path, backup_path)
-                
-            # Delete the asset
-            full_asset_path.unlink()
+
+                # Backup + delete is just a rename when backups/ sits on
+                # the same filesystem as the asset (the normal layout);
+                # fall back to copy-and-unlink across mount points
+                try:
+                    # Same inode, so timestamps survive as with copy2
+                    os.rename(full_asset_path, backup_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.copy2(full_asset_path, backup_path)
+                    full_asset_path.unlink()
+            else:
+                # Delete the asset
+                full_asset_path.unlink()
             
             # Update asset registry
             self._unregister_asset(brand_name, asset_path)
@@ -1375,30 +1811,44 @@ class AssetManager:
                 except Exception as e:
                     logger.warning(f"Could not load brand config for cleanup: {e}")
                     
-            # Process all files
-            for asset_path in list(assets_dir.rglob("*")):
-                if asset_path.is_file():
+            # Single bottom-up walk: process files, then try to drop each
+            # directory once its children are gone
+            assets_root = str(assets_dir)
+            # Config references are brand-root relative ('assets/...'), so
+            # anchor the comparison prefix there
+            prefix_len = len(str(brand_path)) + 1
+            sep = os.sep
+            for dirpath, dirnames, filenames in os.walk(assets_root, topdown=False):
+                # Relative prefix for this directory, posix-normalized to
+                # match _extract_referenced_assets
+                rel_dir = dirpath[prefix_len:]
+                if sep != '/':
+                    rel_dir = rel_dir.replace(sep, '/')
+                rel_prefix = rel_dir + '/' if rel_dir else ''
+
+                for filename in filenames:
                     cleanup_summary['files_processed'] += 1
-                    
-                    # Check if file should be removed
-                    should_remove = False
-                    relative_path = asset_path.relative_to(assets_dir)
-                    
-                    if remove_unused and str(relative_path) not in referenced_assets:
-                        should_remove = True
-                        
-                    if should_remove:
-                        file_size = asset_path.stat().st_size
-                        asset_path.unlink()
+                    file_path = os.path.join(dirpath, filename)
+
+                    # load_brand rewrites referenced assets to absolute
+                    # paths, so check the absolute form as well as the
+                    # brand-root-relative one used in raw configs
+                    if remove_unused and \
+                            rel_prefix + filename not in referenced_assets and \
+                            (file_path if sep == '/' else file_path.replace(sep, '/')) \
+                            not in referenced_assets:
+                        file_size = os.stat(file_path).st_size
+                        os.unlink(file_path)
                         cleanup_summary['files_removed'] += 1
                         cleanup_summary['space_reclaimed'] += file_size
+
+                if dirpath != assets_root:
+                    try:
+                        os.rmdir(dirpath)
+                        cleanup_summary['empty_dirs_removed'] += 1
+                    except OSError:
+                        pass  # still has contents
                         
-            # Remove empty directories
-            for dir_path in list(assets_dir.rglob("*")):
-                if dir_path.is_dir() and not any(dir_path.iterdir()):
-                    dir_path.rmdir()
-                    cleanup_summary['empty_dirs_removed'] += 1
-                    
             logger.info(f"Cleaned up assets for brand {brand_name}")
             
             return {
@@ -1414,111 +1864,128 @@ class AssetManager:
     
     def _is_allowed_file_type(self, file_ext: str) -> bool:
         """Check if file extension is allowed."""
-        return file_ext in (self.ALLOWED_IMAGE_TYPES | self.ALLOWED_FONT_TYPES | self.ALLOWED_OTHER_TYPES)
-        
+        return file_ext in self._ALLOWED_ALL_TYPES
+        
+    _ASSET_DIRS = {
+        'logo': 'assets/images',
+        'image': 'assets/images',
+        'font': 'assets/fonts',
+        'css': 'assets',
+        'template': 'templates'
+    }
+
     def _get_asset_directory(self, brand_path: Path, asset_type: str) -> Path:
         """Get the appropriate subdirectory for an asset type."""
-        asset_dirs = {
-            'logo': 'assets/images',
-            'image': 'assets/images',
-            'font': 'assets/fonts',
-            'css': 'assets',
-            'template': 'templates'
-        }
-        
-        subdir = asset_dirs.get(asset_type, 'assets/misc')
-        return brand_path / subdir
+        return brand_path / self._ASSET_DIRS.get(asset_type, 'assets/misc')
         
     def _generate_unique_filename(self, directory: Path, filename: str) -> str:
         """Generate a unique filename if the original already exists."""
-        stem = Path(filename).stem
-        suffix = Path(filename).suffix
+        stem, suffix = os.path.splitext(filename)
         counter = 1
-        
-        while (directory / filename).exists():
+
+        # One directory read instead of a stat per probe
+        existing = {entry.name for entry in os.scandir(directory)}
+        while filename in existing:
             filename = f"{stem}_{counter}{suffix}"
             counter += 1
-            
+
         return filename
         
-    def _infer_asset_type(self, relative_path: Path) -> str:
+    def _infer_asset_type(self, relative_path: str) -> str:
         """Infer asset type from its relative path within assets directory."""
-        parts = relative_path.parts
-        
+        parts = relative_path.split(os.sep)
+
         if 'images' in parts:
             return 'image'
         elif 'fonts' in parts:
             return 'font'
-        elif relative_path.suffix.lower() == '.css':
+        elif os.path.splitext(relative_path)[1].lower() == '.css':
             return 'css'
         else:
             return 'misc'
             
+    def _registry_path(self, brand_name: str) -> Path:
+        return self.brand_manager.brands_root / brand_name / "asset_registry.json"
+
+    def _load_registry(self, brand_name: str) -> Dict[str, Any]:
+        """Load a brand's asset registry, serving repeat calls from cache."""
+        registry = self._registry_cache.get(brand_name)
+        if registry is None:
+            try:
+                registry = json.loads(self._registry_path(brand_name).read_bytes())
+            except FileNotFoundError:
+                registry = {}
+            self._registry_cache[brand_name] = registry
+        return registry
+
+    def flush_registry(self, brand_name: Optional[str] = None) -> None:
+        """
+        Write dirty asset registries back to disk.
+
+        Args:
+            brand_name: Flush only this brand's registry; all dirty
+                registries when omitted
+        """
+        dirty = [brand_name] if brand_name else list(self._registry_dirty)
+        for name in dirty:
+            if name not in self._registry_dirty:
+                continue
+            registry_path = self._registry_path(name)
+            tmp_path = registry_path.with_suffix('.json.tmp')
+            try:
+                tmp_path.write_text(
+                    json.dumps(self._registry_cache[name], separators=(',', ':'))
+                )
+                os.replace(tmp_path, registry_path)
+                self._registry_dirty.discard(name)
+            except Exception as e:
+                logger.warning(f"Failed to update asset registry: {e}")
+
     def _register_asset(self, brand_name: str, filename: str, asset_record: BrandAsset) -> None:
         """Register asset in the brand's asset registry."""
         # This would update a registry file or database in a full implementation
         # For now, we'll use a simple JSON file approach
-        brand_path = self.brand_manager.brands_root / brand_name
-        registry_path = brand_path / "asset_registry.json"
-        
-        try:
-            if registry_path.exists():
-                with open(registry_path, 'r') as f:
-                    registry = json.load(f)
-            else:
-                registry = {}
-                
-            registry[filename] = {
-                'asset_type': asset_record.asset_type,
-                'file_size': asset_record.file_size,
-                'checksum': asset_record.checksum,
-                'uploaded_at': asset_record.uploaded_at.isoformat(),
-                'metadata': asset_record.metadata
-            }
-            
-            with open(registry_path, 'w') as f:
-                json.dump(registry, f, indent=2)
-                
-        except Exception as e:
-            logger.warning(f"Failed to update asset registry: {e}")
-            
+        registry = self._load_registry(brand_name)
+        registry[filename] = {
+            'asset_type': asset_record.asset_type,
+            'file_size': asset_record.file_size,
+            'checksum': asset_record.checksum,
+            'uploaded_at': asset_record.uploaded_at.isoformat(),
+            'metadata': asset_record.metadata
+        }
+        self._registry_dirty.add(brand_name)
+        self.flush_registry(brand_name)
+
     def _unregister_asset(self, brand_name: str, asset_path: str) -> None:
         """Remove asset from the brand's asset registry."""
-        brand_path = self.brand_manager.brands_root / brand_name
-        registry_path = brand_path / "asset_registry.json"
-        
-        try:
-            if not registry_path.exists():
-                return
-                
-            with open(registry_path, 'r') as f:
-                registry = json.load(f)
-                
-            filename = Path(asset_path).name
-            if filename in registry:
-                del registry[filename]
-                
-                with open(registry_path, 'w') as f:
-                    json.dump(registry, f, indent=2)
-                    
-        except Exception as e:
-            logger.warning(f"Failed to update asset registry: {e}")
-            
-    def _extract_referenced_assets(self, brand_config: BrandConfig) -> set:
-        """Extract all asset paths referenced in brand configuration."""
+        registry = self._load_registry(brand_name)
+        filename = os.path.basename(asset_path)
+        if filename in registry:
+            del registry[filename]
+            self._registry_dirty.add(brand_name)
+            self.flush_registry(brand_name)
+            
+    def _extract_referenced_assets(self, brand_config: BrandConfig) -> frozenset:
+        """
+        Extract all asset paths referenced in brand configuration.
+
+        Paths are normalized to forward slashes so callers can compare
+        os-level relative paths against the set after the same
+        normalization.
+        """
         referenced = set()
-        
+
         # Extract from assets section
         for asset_path in brand_config.assets.values():
             if isinstance(asset_path, list):
-                referenced.update(asset_path)
+                referenced.update(str(p).replace('\\', '/') for p in asset_path)
             else:
-                referenced.add(asset_path)
-                
+                referenced.add(str(asset_path).replace('\\', '/'))
+
         # Extract from templates if they reference assets
         # This could be expanded based on template structure
-        
-        return referenced
+
+        return frozenset(referenced)
 
 
 class BrandTemplateManager:
@@ -1541,7 +2008,10 @@ class BrandTemplateManager:
         """
         self.brand_manager = brand_manager
         self.templates_root = brand_manager.templates_root
-        
+        # Parsed templates keyed by path -> (mtime_ns, size, BrandTemplate);
+        # unchanged files skip the YAML parse on repeat loads
+        self._tpl_cache: Dict[str, Tuple[int, int, BrandTemplate]] = {}
+
     def create_template(self, template_name: str, template_config: Dict[str, Any],
                        description: str, category: str = "custom",
                        features: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -1585,10 +2055,11 @@ class BrandTemplateManager:
             # Validate template configuration
             validation_warnings = self._validate_template_config(template_config)
             
-            # Save template configuration
+            # Save template configuration: serialize in memory, then one
+            # write instead of PyYAML's many small ones
             config_path = template_path / "template_config.yaml"
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(template_config, f, default_flow_style=False, sort_keys=False)
+            text = yaml.dump(template_config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            config_path.write_bytes(text.encode('utf-8'))
                 
             # Create template assets directory if needed
             if template_config.get('assets'):
@@ -1626,17 +2097,24 @@ class BrandTemplateManager:
         """
         template_path = self.templates_root / template_name
         config_path = template_path / "template_config.yaml"
-        
-        if not config_path.exists():
+
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
             raise BrandNotFoundError(f"Template '{template_name}' not found")
-            
+
+        cache_key = str(config_path)
+        cached = self._tpl_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                template_config = yaml.safe_load(f)
-                
+                template_config = yaml.load(f, Loader=_YamlLoader)
+
             template_info = template_config.get('template_info', {})
-            
-            return BrandTemplate(
+
+            template = BrandTemplate(
                 name=template_info.get('name', template_name),
                 description=template_info.get('description', ''),
                 category=template_info.get('category', 'custom'),
@@ -1646,7 +2124,11 @@ class BrandTemplateManager:
                 required_assets=template_info.get('required_assets', []),
                 optional_assets=template_info.get('optional_assets', [])
             )
-            
+
+            # Cache a private copy so caller mutations can't poison it
+            self._tpl_cache[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(template))
+            return template
+
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in template config {config_path}: {e}")
             raise BrandValidationError(f"Invalid template configuration: {e}")
@@ -1654,6 +2136,25 @@ class BrandTemplateManager:
             logger.error(f"Failed to load template {template_name}: {e}")
             raise BrandValidationError(f"Failed to load template: {e}")
             
+    _INDEX_NAME = ".index.json"
+
+    def _load_index(self) -> Dict[str, Any]:
+        """Load the template metadata index; missing or corrupt means empty."""
+        try:
+            return json.loads((self.templates_root / self._INDEX_NAME).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        """Write the index atomically; failures are non-fatal (read-only dirs)."""
+        index_path = self.templates_root / self._INDEX_NAME
+        tmp_path = index_path.with_suffix('.json.tmp')
+        try:
+            tmp_path.write_text(json.dumps(index, separators=(',', ':')))
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.debug(f"Could not write template index: {e}")
+
     def list_templates(self, category_filter: Optional[str] = None) -> Dict[str, Any]:
         """
         List all available templates with metadata.
@@ -1667,36 +2168,84 @@ class BrandTemplateManager:
         try:
             templates_list = []
             categories = set()
-            
-            for template_dir in self.templates_root.iterdir():
-                if not template_dir.is_dir():
-                    continue
-                    
-                config_path = template_dir / "template_config.yaml"
-                if not config_path.exists():
-                    continue
-                    
-                try:
-                    template = self.load_template(template_dir.name)
-                    categories.add(template.category)
-                    
-                    if category_filter and template.category != category_filter:
+
+            # Persistent metadata index: unchanged templates (matching
+            # mtime_ns/size) are served from .index.json with no YAML parse
+            index = self._load_index()
+            index_changed = False
+            seen = set()
+            infos = []
+            misses = []
+
+            # scandir hands back cached is_dir() results, so each template
+            # costs one stat for the config probe instead of three
+            with os.scandir(self.templates_root) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
                         continue
-                        
-                    templates_list.append({
-                        'name': template.name,
-                        'description': template.description,
-                        'category': template.category,
-                        'version': template.version,
-                        'features': template.features,
-                        'required_assets': template.required_assets,
-                        'optional_assets': template.optional_assets
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to load template {template_dir.name}: {e}")
+
+                    config_path = os.path.join(entry.path, "template_config.yaml")
+                    try:
+                        st = os.stat(config_path)
+                    except FileNotFoundError:
+                        continue
+
+                    cached = index.get(entry.name)
+                    if cached is not None and cached.get('mtime_ns') == st.st_mtime_ns \
+                            and cached.get('size') == st.st_size:
+                        seen.add(entry.name)
+                        infos.append(cached['info'])
+                    else:
+                        misses.append((entry.name, st))
+
+            # Index misses parse YAML concurrently: the reads and libyaml
+            # both release the GIL, so a cold start overlaps its I/O
+            if misses:
+                def _load_one(item):
+                    name, st = item
+                    try:
+                        return name, st, self.load_template(name)
+                    except Exception as e:
+                        logger.warning(f"Failed to load template {name}: {e}")
+                        return name, st, None
+
+                with ThreadPoolExecutor(max_workers=min(16, len(misses))) as executor:
+                    for name, st, template in executor.map(_load_one, misses):
+                        if template is None:
+                            continue
+                        info = {
+                            'name': template.name,
+                            'description': template.description,
+                            'category': template.category,
+                            'version': template.version,
+                            'features': template.features,
+                            'required_assets': template.required_assets,
+                            'optional_assets': template.optional_assets
+                        }
+                        index[name] = {
+                            'mtime_ns': st.st_mtime_ns,
+                            'size': st.st_size,
+                            'info': info
+                        }
+                        index_changed = True
+                        seen.add(name)
+                        infos.append(info)
+
+            for info in infos:
+                categories.add(info['category'])
+
+                if category_filter and info['category'] != category_filter:
                     continue
-                    
+
+                templates_list.append(dict(info))
+
+            # Prune deleted templates and persist the refreshed index
+            stale = [name for name in index if name not in seen]
+            for name in stale:
+                del index[name]
+            if index_changed or stale:
+                self._save_index(index)
+
             # Sort by category, then name
             templates_list.sort(key=lambda x: (x['category'], x['name']))
             
@@ -1730,13 +2279,27 @@ class BrandTemplateManager:
             raise BrandNotFoundError(f"Template '{template_name}' not found")
             
         try:
-            # Load current template
-            with open(config_path, 'r', encoding='utf-8') as f:
-                current_config = yaml.safe_load(f)
-                
+            # Load current template (served from the parse cache when warm;
+            # load_template hands back a private copy safe to merge into)
+            current_config = self.load_template(template_name).config
+
             # Apply updates
             updated_config = self.brand_manager._merge_configs(current_config, updates)
-            
+
+            # Skip the dump and disk write entirely when the merge changed
+            # nothing; compare against the cache's untouched copy
+            cached = self._tpl_cache.get(str(config_path))
+            if cached is not None and updated_config == cached[2].config:
+                return {
+                    'success': True,
+                    'template_name': template_name,
+                    'updated_fields': list(updates.keys()),
+                    'validation_warnings': [],
+                    'version': updated_config.get('template_info', {}).get('version', '1.0.0'),
+                    'skipped': True,
+                    'message': f"Template '{template_name}' already up to date."
+                }
+
             # Update template metadata
             updated_config.setdefault('template_info', {})
             template_info = updated_config['template_info']
@@ -1755,10 +2318,12 @@ class BrandTemplateManager:
             # Validate updated template
             validation_warnings = self._validate_template_config(updated_config)
             
-            # Save updated template
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(updated_config, f, default_flow_style=False, sort_keys=False)
-                
+            # Save updated template in a single write
+            text = yaml.dump(updated_config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            config_path.write_bytes(text.encode('utf-8'))
+
+            self._tpl_cache.pop(str(config_path), None)
+
             logger.info(f"Successfully updated template: {template_name}")
             
             return {
@@ -1806,7 +2371,8 @@ class BrandTemplateManager:
                 
             # Delete template directory
             shutil.rmtree(template_path)
-            
+            self._tpl_cache.pop(str(template_path / "template_config.yaml"), None)
+
             logger.info(f"Successfully deleted template: {template_name}")
             
             return {
@@ -1868,8 +2434,8 @@ class BrandTemplateManager:
             }
     
     def _is_valid_template_name(self, name: str) -> bool:
-        """Validate template name."""
-        return self.brand_manager._is_valid_brand_name(name)
+        """Validate template name; same rules and regex as brand names."""
+        return _BRAND_NAME_RE.match(name) is not None
         
     def _validate_template_config(self, config: Dict[str, Any]) -> List[str]:
         """Validate template configuration structure."""
@@ -1905,13 +2471,9 @@ class BrandTemplateManager:
         asset_types = set()
         for asset in template.required_assets + template.optional_assets:
             if isinstance(asset, str):
-                ext = Path(asset).suffix.lower()
-                if ext in {'.png', '.jpg', '.jpeg', '.svg'}:
-                    asset_types.add('image')
-                elif ext in {'.woff', '.woff2', '.ttf', '.otf'}:
-                    asset_types.add('font')
-                elif ext == '.css':
-                    asset_types.add('css')
+                kind = _EXT_KIND.get(os.path.splitext(asset)[1].lower())
+                if kind:
+                    asset_types.add(kind)
                     
         if not asset_types:
             issues.append("Template doesn't specify any standard asset types")
@@ -1920,40 +2482,42 @@ class BrandTemplateManager:
         
     def _extract_required_assets(self, config: Dict[str, Any]) -> List[str]:
         """Extract required asset paths from template configuration."""
-        required = []
-        
+        # dict keys dedupe in one pass and keep insertion order, unlike
+        # the list(set(...)) round-trip
+        required: Dict[str, None] = {}
+
         # Extract from assets section
         assets = config.get('assets', {})
         for key, value in assets.items():
             if isinstance(value, list):
-                required.extend(value)
+                required.update(dict.fromkeys(value))
             elif value:
-                required.append(value)
-                
+                required[value] = None
+
         # Extract from compliance rules
         compliance = config.get('compliance', {})
         if 'required_assets' in compliance:
-            required.extend(compliance['required_assets'])
-            
-        return list(set(required))  # Remove duplicates
-        
+            required.update(dict.fromkeys(compliance['required_assets']))
+
+        return list(required)
+
     def _extract_optional_assets(self, config: Dict[str, Any]) -> List[str]:
         """Extract optional asset paths from template configuration."""
-        optional = []
-        
+        optional: Dict[str, None] = {}
+
         # This could be expanded based on specific template structure
         # For now, we'll consider watermarks, additional logos, etc.
         assets = config.get('assets', {})
         optional_keys = ['watermark', 'favicon', 'background']
-        
+
         for key in optional_keys:
             if key in assets and assets[key]:
                 if isinstance(assets[key], list):
-                    optional.extend(assets[key])
+                    optional.update(dict.fromkeys(assets[key]))
                 else:
-                    optional.append(assets[key])
-                    
-        return list(set(optional))
+                    optional[assets[key]] = None
+
+        return list(optional)
         
     def _has_template_changes(self, updates: Dict[str, Any]) -> bool:
         """Determine if updates warrant version increment."""
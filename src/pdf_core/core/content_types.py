@@ -5,10 +5,15 @@ This module provides the basic data structures needed for template rendering
 without dependencies on specific input processors.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# Skips <...> tag regions, captures word runs: one C-level pass with no
+# intermediate tag-stripped copy of the document
+_HTML_WORD_RE = re.compile(r'<[^>]+>|(\S+)')
+
 
 @dataclass
 class ProcessedInput:
@@ -37,9 +42,9 @@ class ProcessedInput:
             
         if not self.word_count and self.html_content:
             # Simple word count estimation from HTML content
-            import re
-            text_content = re.sub(r'<[^>]+>', '', self.html_content)
-            self.word_count = len(text_content.split())
+            self.word_count = sum(
+                1 for m in _HTML_WORD_RE.finditer(self.html_content) if m.group(1)
+            )
 
 
 @dataclass 
@@ -6,6 +6,7 @@ Handles markdown file parsing, frontmatter extraction, and content preprocessing
 
 import re
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
@@ -47,19 +48,61 @@ class InputProcessor:
             'abbr'
         ]
         
-        self.md = markdown.Markdown(
-            extensions=self.markdown_extensions,
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'use_pygments': True
-                },
-                'toc': {
-                    'permalink': True,
-                    'baselevel': 1
-                }
-            }
+        # Markdown construction registers every extension, which is costly;
+        # build lazily and per-thread (see the md property) so idle
+        # processors pay nothing and threads don't share reset() state
+        self._tls = threading.local()
+
+        # Shortcode patterns, compiled once and fused into two alternations
+        # so the content is scanned twice instead of once per tag
+        self._sc_simple = re.compile(r'\[(TOC|BREAK|PAGE_BREAK)\]', re.IGNORECASE)
+        self._sc_block = re.compile(
+            r'\[(INFO|WARNING|SUCCESS)\](.*?)\[/\1\]',
+            re.IGNORECASE | re.DOTALL
         )
+        self._sc_simple_repl = {
+            'TOC': '',
+            'BREAK': '<div class="page-break"></div>',
+            'PAGE_BREAK': '<div class="page-break"></div>'
+        }
+        self._sc_block_class = {
+            'INFO': 'info-box',
+            'WARNING': 'warning-box',
+            'SUCCESS': 'success-box'
+        }
+
+        # Word-count tokenizer: skips code blocks, inline code and links,
+        # captures word runs, all in one scan with no intermediate strings
+        self._wc_re = re.compile(
+            r'```.*?```|`[^`]*`|\[[^\]]*\]\([^)]*\)|([^\s#*_`\[\]()]+)',
+            re.DOTALL
+        )
+
+        # Title heading patterns; searched with an endpos bound so large
+        # documents are never scanned past the head
+        self._title_h1_re = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+        self._title_setext_re = re.compile(r'^([^\n]*\S[^\n]*)\n=+[ \t]*$', re.MULTILINE)
+
+    @property
+    def md(self) -> markdown.Markdown:
+        """Thread-local Markdown instance, built on first use."""
+        md = getattr(self._tls, 'md', None)
+        if md is None:
+            md = markdown.Markdown(
+                extensions=self.markdown_extensions,
+                extension_configs={
+                    'codehilite': {
+                        'css_class': 'highlight',
+                        'use_pygments': True
+                    },
+                    'toc': {
+                        'permalink': True,
+                        'baselevel': 1
+                    }
+                }
+            )
+            self._tls.md = md
+        return md
         
     def process_file(self, file_path: Path) -> ProcessedInput:
         """
@@ -79,7 +122,12 @@ class InputProcessor:
             raise FileNotFoundError(f"File not found: {file_path}")
             
         try:
-            content = file_path.read_text(encoding='utf-8')
+            # Raw read + one decode skips the text layer; CRLF still has
+            # to be normalized because the line-anchored patterns (setext
+            # titles in particular) expect bare newlines
+            content = file_path.read_bytes().decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n')
             return self.process_content(content, str(file_path))
         except Exception as e:
             raise ValueError(f"Error processing file {file_path}: {e}")
@@ -97,9 +145,7 @@ class InputProcessor:
         """
         try:
             # Parse frontmatter and content
-            post = frontmatter.loads(content)
-            metadata = post.metadata
-            raw_markdown = post.content
+            metadata, raw_markdown = self._parse_frontmatter(content)
             
             # Process shortcodes before markdown conversion
             processed_content = self._process_shortcodes(raw_markdown)
@@ -131,6 +177,27 @@ class InputProcessor:
             logger.error(f"Error processing content from {filename}: {e}")
             raise ValueError(f"Error processing markdown content: {e}")
     
+    def _parse_frontmatter(self, content: str) -> tuple:
+        """
+        Split content into (metadata, markdown body).
+
+        Plain markdown — the common case — never starts with a '---'
+        delimiter, so skip the frontmatter parser entirely unless one is
+        present (allowing for a BOM).
+
+        Args:
+            content: Markdown content with optional frontmatter
+
+        Returns:
+            Tuple of (metadata dict, raw markdown string)
+        """
+        head = content[:4]
+        if head[:3] != '---' and head != '\ufeff---':
+            return {}, content
+
+        post = frontmatter.loads(content)
+        return post.metadata, post.content
+
     def _process_shortcodes(self, content: str) -> str:
         """
         Process custom shortcodes in content.
@@ -141,35 +208,18 @@ class InputProcessor:
         Returns:
             Content with shortcodes processed
         """
-        # Process TOC shortcode
-        content = re.sub(r'\[TOC\]', '', content, flags=re.IGNORECASE)
-        
-        # Process break shortcodes
-        content = re.sub(r'\[BREAK\]', '<div class="page-break"></div>', content, flags=re.IGNORECASE)
-        content = re.sub(r'\[PAGE_BREAK\]', '<div class="page-break"></div>', content, flags=re.IGNORECASE)
-        
-        # Process info boxes
-        content = re.sub(
-            r'\[INFO\](.*?)\[/INFO\]', 
-            r'<div class="info-box">\1</div>', 
-            content, 
-            flags=re.IGNORECASE | re.DOTALL
+        # TOC and break shortcodes share one alternation
+        content = self._sc_simple.sub(
+            lambda m: self._sc_simple_repl[m.group(1).upper()], content
         )
-        
-        content = re.sub(
-            r'\[WARNING\](.*?)\[/WARNING\]', 
-            r'<div class="warning-box">\1</div>', 
-            content, 
-            flags=re.IGNORECASE | re.DOTALL
-        )
-        
-        content = re.sub(
-            r'\[SUCCESS\](.*?)\[/SUCCESS\]', 
-            r'<div class="success-box">\1</div>', 
-            content, 
-            flags=re.IGNORECASE | re.DOTALL
+
+        # Info/warning/success boxes share the other
+        content = self._sc_block.sub(
+            lambda m: (f'<div class="{self._sc_block_class[m.group(1).upper()]}">'
+                       f'{m.group(2)}</div>'),
+            content
         )
-        
+
         return content
     
     def _extract_title_from_content(self, content: str) -> str:
@@ -182,17 +232,17 @@ class InputProcessor:
         Returns:
             Extracted title or empty string
         """
-        # Look for first H1 heading
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        # Headings live near the top, so bound both searches to the first
+        # 4 KB instead of splitting the whole document into lines
+        match = self._title_h1_re.search(content, 0, 4096)
         if match:
             return match.group(1).strip()
-        
+
         # Look for underlined heading
-        lines = content.split('\n')
-        for i, line in enumerate(lines[:-1]):
-            if line.strip() and lines[i + 1].strip().startswith('='):
-                return line.strip()
-        
+        match = self._title_setext_re.search(content, 0, 4096)
+        if match:
+            return match.group(1).strip()
+
         return ""
     
     def _calculate_word_count(self, content: str) -> int:
@@ -205,16 +255,6 @@ class InputProcessor:
         Returns:
             Word count
         """
-        # Remove markdown formatting
-        text = re.sub(r'[#*_`\[\]()]', '', content)
-        
-        # Remove code blocks
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
-        text = re.sub(r'`.*?`', '', text)
-        
-        # Remove links
-        text = re.sub(r'\[.*?\]\(.*?\)', '', text)
-        
-        # Count words
-        words = text.split()
-        return len([word for word in words if word.strip()])
\ No newline at end of file
+        # Single tokenizer pass: code blocks, inline code and links match
+        # without the capture group and are skipped; word runs capture
+        return sum(1 for m in self._wc_re.finditer(content) if m.group(1))
\ No newline at end of file
@@ -5,8 +5,14 @@ Handles Playwright browser integration and HTML to PDF conversion with
 print optimization and brand-specific formatting.
 """
 
+import atexit
 import logging
+import queue
+import sys
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, field
@@ -17,6 +23,85 @@ from .template_engine import RenderedTemplate
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses avoid the per-instance __dict__ on Python >= 3.10
+_SLOTS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Chromium launch arguments tuned for headless PDF rendering
+_DEFAULT_BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--font-render-hinting=none',
+    '--disable-font-subpixel-positioning',
+]
+
+# Styles forcing exact color reproduction in print output, injected once
+# per page during preparation
+_PRINT_COLOR_STYLE = """
+    @page {
+        -webkit-print-color-adjust: exact;
+        color-adjust: exact;
+    }
+
+    body {
+        -webkit-print-color-adjust: exact;
+        print-color-adjust: exact;
+    }
+
+    * {
+        -webkit-print-color-adjust: exact;
+        print-color-adjust: exact;
+    }
+"""
+
+# Process-wide shared browser for callers that opt in with
+# use_global_browser: launched on first use, torn down at interpreter exit
+_GLOBAL_LOCK = threading.Lock()
+_GLOBAL_PW = None
+_GLOBAL_BROWSER = None
+
+
+def _get_global_browser(headless: bool = True, browser_args: Optional[list] = None):
+    """
+    Return the process-wide browser, launching it on first use.
+
+    Launch arguments are fixed by the first caller; later callers share
+    the browser as-is.
+    """
+    global _GLOBAL_PW, _GLOBAL_BROWSER
+    with _GLOBAL_LOCK:
+        if _GLOBAL_BROWSER is None or not _GLOBAL_BROWSER.is_connected():
+            if _GLOBAL_PW is None:
+                _GLOBAL_PW = sync_playwright().start()
+            _GLOBAL_BROWSER = _GLOBAL_PW.chromium.launch(
+                headless=headless,
+                args=_DEFAULT_BROWSER_ARGS + (browser_args or [])
+            )
+            logger.info("Global browser started")
+    return _GLOBAL_BROWSER
+
+
+def _shutdown_global_browser() -> None:
+    """Close the shared browser and Playwright at interpreter exit."""
+    global _GLOBAL_PW, _GLOBAL_BROWSER
+    with _GLOBAL_LOCK:
+        if _GLOBAL_BROWSER is not None:
+            try:
+                _GLOBAL_BROWSER.close()
+            except Exception as e:
+                logger.debug(f"Error closing global browser: {e}")
+            _GLOBAL_BROWSER = None
+        if _GLOBAL_PW is not None:
+            try:
+                _GLOBAL_PW.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping global playwright: {e}")
+            _GLOBAL_PW = None
+
+
+atexit.register(_shutdown_global_browser)
+
 
 @dataclass
 class PDFConfig:
@@ -52,14 +137,15 @@ class PDFConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass 
+@dataclass(**_SLOTS_KWARGS)
 class GeneratedPDF:
     """Represents a generated PDF with metadata."""
-    
-    pdf_path: Path
+
+    pdf_path: Optional[Path]
     file_size: int
     page_count: int = 0
     generation_time: float = 0.0
+    pdf_bytes: Optional[bytes] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -67,6 +153,110 @@ class GeneratedPDF:
             self.metadata = {}
 
 
+class BrowserPool:
+    """
+    Pool of pre-launched Chromium instances for concurrent PDF generation.
+
+    Browser startup costs hundreds of milliseconds, so browsers are launched
+    once and handed out per job; each job gets a fresh, isolated context
+    (cookies, cache, pages) that is cheap to create and discard. Browsers
+    are recycled after serving ``recycle_after`` contexts to bound Chromium
+    memory growth in long-running processes.
+    """
+
+    def __init__(
+        self,
+        playwright,
+        size: int = 4,
+        headless: bool = True,
+        browser_args: Optional[list] = None,
+        recycle_after: int = 100
+    ):
+        """
+        Launch the pool.
+
+        Args:
+            playwright: Started Playwright instance that owns the browsers
+            size: Number of browsers to pre-launch
+            headless: Whether browsers run headless
+            browser_args: Extra launch arguments merged with the defaults
+            recycle_after: Contexts a browser serves before it is replaced
+        """
+        self._playwright = playwright
+        self._headless = headless
+        self._browser_args = browser_args or []
+        self._recycle_after = recycle_after
+        self._lock = threading.Lock()
+        self._contexts_served: Dict[int, int] = {}
+        self._recycled = 0
+        self._queue: "queue.Queue[Browser]" = queue.Queue()
+        self.browsers: list = []
+        for _ in range(size):
+            self._queue.put(self._launch())
+
+    def _launch(self) -> Browser:
+        """Launch one browser and register it with the pool."""
+        browser = self._playwright.chromium.launch(
+            headless=self._headless,
+            args=_DEFAULT_BROWSER_ARGS + self._browser_args
+        )
+        with self._lock:
+            self._contexts_served[id(browser)] = 0
+            self.browsers.append(browser)
+        return browser
+
+    def acquire(self) -> Browser:
+        """Check out a browser, blocking until one is free."""
+        return self._queue.get()
+
+    def release(self, browser: Browser) -> None:
+        """
+        Return a browser after a job, recycling it if it has served its quota.
+        """
+        with self._lock:
+            served = self._contexts_served.get(id(browser), 0) + 1
+            self._contexts_served[id(browser)] = served
+            recycle = served >= self._recycle_after
+            if recycle:
+                self._contexts_served.pop(id(browser), None)
+                if browser in self.browsers:
+                    self.browsers.remove(browser)
+                self._recycled += 1
+        if recycle:
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing recycled browser: {e}")
+            browser = self._launch()
+        self._queue.put(browser)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool health counters for monitoring."""
+        with self._lock:
+            return {
+                'size': len(self.browsers),
+                'idle': self._queue.qsize(),
+                'contexts_served': sum(self._contexts_served.values()),
+                'recycled': self._recycled,
+            }
+
+    def close(self) -> None:
+        """Close every browser in the pool."""
+        with self._lock:
+            browsers, self.browsers = self.browsers, []
+            self._contexts_served.clear()
+        for browser in browsers:
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}")
+        while not self._queue.empty():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
 class PDFGenerator:
     """
     Generates PDFs from HTML using Playwright and Chromium.
@@ -80,18 +270,42 @@ class PDFGenerator:
     - Batch PDF generation capability
     """
     
-    def __init__(self, headless: bool = True, browser_args: Optional[list] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        browser_args: Optional[list] = None,
+        pool_size: Optional[int] = None,
+        pool_recycle_after: int = 100,
+        use_global_browser: bool = False
+    ):
         """
         Initialize the PDFGenerator.
-        
+
         Args:
             headless: Whether to run browser in headless mode
             browser_args: Additional browser launch arguments
+            pool_size: If set, run a BrowserPool of this many browsers and
+                       give each job an isolated context instead of sharing
+                       one browser's pages
+            pool_recycle_after: Contexts a pooled browser serves before it
+                                is recycled
+            use_global_browser: Share the process-wide browser instead of
+                                launching one per generator; it stays up
+                                across generators and is closed at exit
         """
         self.headless = headless
         self.browser_args = browser_args or []
+        self.pool_size = pool_size
+        self.pool_recycle_after = pool_recycle_after
+        self.use_global_browser = use_global_browser
+        self._owns_browser = True
         self.playwright = None
         self.browser = None
+        self.pool: Optional[BrowserPool] = None
+        # Idle pages kept warm for reuse in single-browser mode, and the
+        # pages already configured for print so setup runs once per page
+        self._page_pool: "deque[Page]" = deque()
+        self._prepared_pages: set = set()
         
     def __enter__(self):
         """Context manager entry - start browser."""
@@ -105,38 +319,70 @@ class PDFGenerator:
     def _start_browser(self) -> None:
         """Start Playwright browser instance."""
         try:
+            if self.use_global_browser:
+                self.browser = _get_global_browser(self.headless, self.browser_args)
+                self._owns_browser = False
+
+                # Seed the page pool so the first job skips page creation
+                self._page_pool.append(self._new_page())
+                return
+
             self.playwright = sync_playwright().start()
-            
-            # Launch browser with optimized settings for PDF generation
-            launch_options = {
-                'headless': self.headless,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--font-render-hinting=none',
-                    '--disable-font-subpixel-positioning',
-                ] + self.browser_args
-            }
-            
-            self.browser = self.playwright.chromium.launch(**launch_options)
-            logger.info("Browser started successfully")
-            
+
+            if self.pool_size:
+                self.pool = BrowserPool(
+                    self.playwright,
+                    size=self.pool_size,
+                    headless=self.headless,
+                    browser_args=self.browser_args,
+                    recycle_after=self.pool_recycle_after
+                )
+                # Keep the legacy attribute pointing at a live browser so
+                # callers that check it keep working
+                self.browser = self.pool.browsers[0]
+                logger.info(f"Browser pool started with {self.pool_size} browsers")
+            else:
+                # Launch browser with optimized settings for PDF generation
+                launch_options = {
+                    'headless': self.headless,
+                    'args': _DEFAULT_BROWSER_ARGS + self.browser_args
+                }
+
+                self.browser = self.playwright.chromium.launch(**launch_options)
+
+                # Seed the page pool so the first job skips page creation
+                self._page_pool.append(self._new_page())
+                logger.info("Browser started successfully")
+
         except Exception as e:
             logger.error(f"Failed to start browser: {e}")
             raise RuntimeError(f"Browser startup failed: {e}")
-            
+
     def _stop_browser(self) -> None:
         """Stop Playwright browser instance."""
         try:
-            if self.browser:
+            if self.pool:
+                self.pool.close()
+                logger.debug("Browser pool stopped")
+            elif self.browser and not self._owns_browser:
+                # Shared browser stays up; just drop the pages we created
+                for page in self._page_pool:
+                    try:
+                        page.close()
+                    except Exception as e:
+                        logger.debug(f"Error closing pooled page: {e}")
+                logger.debug("Detached from global browser")
+            elif self.browser:
                 self.browser.close()
                 logger.debug("Browser stopped")
         except Exception as e:
             logger.warning(f"Error stopping browser: {e}")
         finally:
             self.browser = None
+            self.pool = None
+            self._owns_browser = True
+            self._page_pool.clear()
+            self._prepared_pages.clear()
                 
         try:
             if self.playwright:
@@ -146,7 +392,40 @@ class PDFGenerator:
             logger.warning(f"Error stopping playwright: {e}")
         finally:
             self.playwright = None
-            
+
+    def _new_page(self) -> Page:
+        """Create a page with the standard viewport, prepared for print."""
+        page = self.browser.new_page()
+        page.set_viewport_size({"width": 1200, "height": 1600})
+        # Warm up print emulation here so jobs find the page ready
+        self._configure_page_for_pdf(page)
+        return page
+
+    def _acquire_page(self) -> Page:
+        """Reuse an idle page if one is available, else create one."""
+        if self._page_pool:
+            return self._page_pool.popleft()
+        return self._new_page()
+
+    def _release_page(self, page: Page) -> None:
+        """Reset a page and return it to the idle pool for reuse."""
+        try:
+            # Dropping back to about:blank frees the rendered document while
+            # keeping the page (and its print configuration) alive
+            page.goto("about:blank")
+            self._page_pool.append(page)
+        except Exception as e:
+            logger.debug(f"Could not reset page for reuse, discarding: {e}")
+            self._discard_page(page)
+
+    def _discard_page(self, page: Page) -> None:
+        """Close a page whose state can no longer be trusted."""
+        self._prepared_pages.discard(page)
+        try:
+            page.close()
+        except Exception as e:
+            logger.debug(f"Error closing discarded page: {e}")
+
     def generate_pdf(
         self,
         rendered_template: RenderedTemplate,
@@ -168,9 +447,9 @@ class PDFGenerator:
             RuntimeError: If browser is not started or PDF generation fails
             PlaywrightTimeoutError: If page loading times out
         """
-        if not self.browser:
+        if not self.browser and not self.pool:
             raise RuntimeError("Browser not started. Use context manager or call _start_browser()")
-            
+
         config = pdf_config or PDFConfig()
         
         # Determine output path
@@ -187,38 +466,61 @@ class PDFGenerator:
         final_output_path.parent.mkdir(parents=True, exist_ok=True)
         
         start_time = __import__('time').time()
-        
+
+        pooled_browser = None
+        context = None
+        page = None
+        completed = False
         try:
-            # Create new page with optimized settings
-            page = self.browser.new_page()
-            
-            # Set viewport for consistent rendering
-            page.set_viewport_size({"width": 1200, "height": 1600})
-            
-            # Configure page for PDF generation
-            self._configure_page_for_pdf(page)
+            if self.pool:
+                # Context-per-job: isolation without paying browser startup
+                pooled_browser = self.pool.acquire()
+                context = pooled_browser.new_context(viewport={"width": 1200, "height": 1600})
+                page = context.new_page()
+
+                # Single-use page: prepare it without entering it into the
+                # reuse bookkeeping, which would retain a reference per job
+                self._configure_page_for_pdf(page, reusable=False)
+            else:
+                # Reuse a warm page when one is idle
+                page = self._acquire_page()
+
+                # Configure page for PDF generation
+                self._configure_page_for_pdf(page)
             
-            # Load HTML content
+            # Load HTML content; "load" fires as soon as resources are in,
+            # without networkidle's trailing 500ms quiet-period wait
             logger.info("Loading HTML content into browser")
-            page.set_content(rendered_template.html_content, wait_until="networkidle", timeout=config.timeout)
-            
-            # Wait for fonts to load
+            page.set_content(rendered_template.html_content, wait_until="load", timeout=config.timeout)
+
+            # Wait for the fonts the document actually uses rather than a
+            # fixed pause; most documents resolve immediately
             if config.wait_for_fonts > 0:
-                logger.debug(f"Waiting {config.wait_for_fonts}ms for fonts to load")
-                page.wait_for_timeout(config.wait_for_fonts)
-            
-            # Generate PDF
+                try:
+                    page.evaluate(
+                        "() => document.fonts ? document.fonts.ready : Promise.resolve()"
+                    )
+                    still_loading = page.evaluate(
+                        "() => document.fonts ? document.fonts.status === 'loading' : false"
+                    )
+                    if still_loading:
+                        # Late-registered fonts: give them one short grace
+                        # period instead of the full configured wait
+                        page.wait_for_timeout(min(config.wait_for_fonts, 250))
+                except Exception as e:
+                    logger.debug(f"Font readiness wait failed: {e}")
+            
+            # Generate PDF; Chromium writes straight to the output path,
+            # skipping the transfer of the PDF bytes into Python and the
+            # extra file write here
             logger.info(f"Generating PDF: {final_output_path}")
             pdf_options = self._build_pdf_options(config, rendered_template)
-            
-            pdf_bytes = page.pdf(**pdf_options)
-            
-            # Write PDF to file
-            with open(final_output_path, 'wb') as f:
-                f.write(pdf_bytes)
-                
-            page.close()
-            
+            pdf_options['path'] = str(final_output_path)
+
+            page.pdf(**pdf_options)
+
+            completed = True
+
             generation_time = __import__('time').time() - start_time
             file_size = final_output_path.stat().st_size
             
@@ -249,35 +551,46 @@ class PDFGenerator:
             if final_output_path.exists():
                 final_output_path.unlink()
             raise RuntimeError(f"PDF generation failed: {e}")
-            
-    def _configure_page_for_pdf(self, page: Page) -> None:
+        finally:
+            if context is not None:
+                try:
+                    context.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser context: {e}")
+            if pooled_browser is not None:
+                self.pool.release(pooled_browser)
+            elif page is not None:
+                # Return healthy pages to the pool; a page that failed
+                # mid-job may hold broken state, so drop it instead
+                if completed:
+                    self._release_page(page)
+                else:
+                    self._discard_page(page)
+
+    def _configure_page_for_pdf(self, page: Page, reusable: bool = True) -> None:
         """
         Configure page settings optimized for PDF generation.
-        
+
         Args:
             page: Playwright page instance
+            reusable: Whether the page outlives this job; single-use pages
+                      (pool mode's context-per-job) skip the prepared-page
+                      tracking so no reference to them is retained
         """
+        # Reused pages keep their print media emulation across navigations,
+        # so setup only needs to run once per page
+        if page in self._prepared_pages:
+            return
+
         # Set media type to print for CSS @media print rules
         page.emulate_media(media="print")
-        
+
         # Add custom styles for better PDF rendering
-        page.add_style_tag(content="""
-            @page {
-                -webkit-print-color-adjust: exact;
-                color-adjust: exact;
-            }
-            
-            body {
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }
-            
-            * {
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }
-        """)
-        
+        page.add_style_tag(content=_PRINT_COLOR_STYLE)
+
+        if reusable:
+            self._prepared_pages.add(page)
+
     def _build_pdf_options(self, config: PDFConfig, rendered_template: RenderedTemplate) -> Dict[str, Any]:
         """
         Build PDF options dictionary from config and template.
@@ -324,39 +637,73 @@ class PDFGenerator:
     def generate_batch_pdfs(
         self,
         templates_and_configs: list,
-        output_directory: Optional[Path] = None
+        output_directory: Optional[Path] = None,
+        max_workers: int = 4
     ) -> list:
         """
         Generate multiple PDFs in batch.
-        
+
+        Multi-job batches are spread across up to ``max_workers`` worker
+        threads. Playwright's sync API binds every object to the thread
+        that created it, so each worker drives its own short-lived browser
+        rather than sharing this generator's; rendering dominates batch
+        time, so the extra launches amortize quickly. Single-job batches
+        run directly on this generator's browser.
+
         Args:
-            templates_and_configs: List of (RenderedTemplate, PDFConfig, filename) tuples
+            templates_and_configs: List of (RenderedTemplate, PDFConfig, filename)
+                tuples, or dicts with 'template', 'config' and 'output_path' keys
             output_directory: Directory for output files
-            
+            max_workers: Upper bound on concurrent browsers
+
         Returns:
-            List of GeneratedPDF objects
+            List of GeneratedPDF objects in job order (failed jobs omitted)
         """
-        if not self.browser:
+        if not self.browser and not self.pool:
             raise RuntimeError("Browser not started. Use context manager or call _start_browser()")
-            
-        results = []
+
         output_dir = output_directory or Path("output")
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        for i, (template, config, filename) in enumerate(templates_and_configs):
+
+        jobs = []
+        for item in templates_and_configs:
+            if isinstance(item, dict):
+                jobs.append((item['template'], item['config'], Path(item['output_path'])))
+            else:
+                template, config, filename = item
+                jobs.append((template, config, output_dir / filename))
+
+        if not jobs:
+            return []
+
+        results: list = [None] * len(jobs)
+
+        def _run(generator, index):
+            template, config, output_path = jobs[index]
             try:
-                output_path = output_dir / filename
-                logger.info(f"Generating PDF {i+1}/{len(templates_and_configs)}: {filename}")
-                
-                result = self.generate_pdf(template, config, output_path)
-                results.append(result)
-                
+                logger.info(f"Generating PDF {index + 1}/{len(jobs)}: {output_path.name}")
+                results[index] = generator.generate_pdf(template, config, output_path)
             except Exception as e:
-                logger.error(f"Failed to generate PDF {filename}: {e}")
+                logger.error(f"Failed to generate PDF {output_path.name}: {e}")
                 # Continue with remaining PDFs
-                
-        logger.info(f"Batch generation complete: {len(results)}/{len(templates_and_configs)} successful")
-        return results
+
+        workers = min(max_workers, len(jobs))
+        if workers <= 1:
+            for index in range(len(jobs)):
+                _run(self, index)
+        else:
+            def _worker(indices):
+                with PDFGenerator(headless=self.headless, browser_args=self.browser_args) as generator:
+                    for index in indices:
+                        _run(generator, index)
+
+            slices = [list(range(start, len(jobs), workers)) for start in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_worker, slices))
+
+        successful = [result for result in results if result is not None]
+        logger.info(f"Batch generation complete: {len(successful)}/{len(jobs)} successful")
+        return successful
         
     def validate_pdf_config(self, config: PDFConfig) -> list:
         """
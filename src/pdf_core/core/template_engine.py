@@ -6,6 +6,7 @@ for PDF conversion.
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -17,6 +18,91 @@ from .brand_manager import BrandConfig
 
 logger = logging.getLogger(__name__)
 
+# First identifier after a Jinja expression or statement opener, e.g. the
+# "brand" in "{{ brand.name }}" or the "content" in "{%- content %}"
+_JINJA_ID_RE = re.compile(r"\{[{%]-?\s*([a-zA-Z_][\w\.]*)")
+
+# Default template file for each supported template type
+_TEMPLATE_MAPPING = {
+    "document": "document.html",
+    "cover": "cover.html",
+    "letter": "letter.html",
+    "report": "report.html",
+    "checklist": "checklist.html",
+    "invoice": "invoice.html",
+    "presentation": "presentation.html",
+    "contract": "contract.html",
+    "newsletter": "newsletter.html",
+    "brochure": "brochure.html",
+    "proposal": "proposal.html"
+}
+
+# Default PDF-friendly styles appended to every brand stylesheet
+_DEFAULT_PDF_STYLES = """
+/* Default PDF-friendly styles */
+body {
+    line-height: 1.4;
+    color: #333;
+    font-size: 11pt;
+    max-width: none;
+}
+
+.page-break {
+    page-break-before: always;
+}
+
+.no-break {
+    page-break-inside: avoid;
+}
+
+h1, h2, h3, h4, h5, h6 {
+    page-break-after: avoid;
+    margin-top: 1em;
+    margin-bottom: 0.5em;
+}
+
+.emergency-callout {
+    background-color: var(--color-error-light, #FEE2E2);
+    border-left: 4px solid var(--color-error, #EF4444);
+    padding: 1em;
+    margin: 1em 0;
+    page-break-inside: avoid;
+}
+
+.highlight {
+    background-color: var(--color-warning-light, #FEF3C7);
+    padding: 0.2em 0.4em;
+    border-radius: 3px;
+}
+
+.brand-cta {
+    background-color: var(--color-primary, #1E3A8A);
+    color: white;
+    padding: 1em;
+    text-align: center;
+    margin: 1.5em 0;
+    border-radius: 5px;
+    page-break-inside: avoid;
+}
+
+.checklist-item {
+    margin: 0.5em 0;
+    padding-left: 1.5em;
+    text-indent: -1.5em;
+}
+
+.checklist-item.checked {
+    color: var(--color-success, #10B981);
+}
+
+.footer {
+    margin-top: 2em;
+    padding-top: 1em;
+    border-top: 1px solid var(--color-text-light, #6B7280);
+    font-size: 0.9em;
+    color: var(--color-text-light, #6B7280);
+}
+"""
 
 
 class TemplateEngine:
@@ -41,49 +127,73 @@ class TemplateEngine:
         """
         self.template_dirs = template_dirs or []
         self.jinja_env = None
+        # Environments cached per brand so repeated renders reuse the
+        # loader and Jinja's compiled-template cache
+        self._env_cache: Dict[Path, Environment] = {}
+        # Resolved template filenames, keyed by (configured value, type)
+        self._filename_cache: Dict[tuple, str] = {}
+        # Assembled brand CSS, keyed by brand, variables and stylesheet mtime
+        self._css_cache: Dict[tuple, str] = {}
         self._setup_jinja_environment()
-        
+
     def _setup_jinja_environment(self) -> None:
         """Set up Jinja2 environment with custom filters and functions."""
         # Will be configured dynamically when rendering
         # since template directories are brand-specific
         pass
-        
-    def _configure_jinja_for_brand(self, brand_config: BrandConfig) -> None:
+
+    def _configure_jinja_for_brand(self, brand_config: BrandConfig) -> Environment:
         """
-        Configure Jinja2 environment for specific brand.
-        
+        Get the Jinja2 environment for a specific brand.
+
+        Environments are built once per brand and cached; Jinja's own
+        bytecode cache then makes repeated renders of the same template
+        skip parsing and compilation entirely.
+
         Args:
             brand_config: Brand configuration containing template paths
+
+        Returns:
+            Configured Jinja2 environment for the brand
         """
-        template_dirs = []
-        
-        # Add brand-specific template directory
-        brand_templates_dir = brand_config.brand_path / "templates"
-        if brand_templates_dir.exists():
-            template_dirs.append(str(brand_templates_dir))
-            
-        # Add any additional template directories
-        template_dirs.extend(self.template_dirs)
-        
-        if not template_dirs:
-            raise ValueError("No template directories found")
-            
-        # Create Jinja2 environment
-        loader = FileSystemLoader(template_dirs)
-        self.jinja_env = Environment(
-            loader=loader,
-            autoescape=True,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self.jinja_env.filters['default'] = self._default_filter
-        
-        # Add custom functions
-        self.jinja_env.globals['format_date'] = self._format_date
-        
+        env = self._env_cache.get(brand_config.brand_path)
+        if env is None:
+            template_dirs = []
+
+            # Add brand-specific template directory
+            brand_templates_dir = brand_config.brand_path / "templates"
+            if brand_templates_dir.exists():
+                template_dirs.append(str(brand_templates_dir))
+
+            # Add any additional template directories
+            template_dirs.extend(self.template_dirs)
+
+            if not template_dirs:
+                raise ValueError("No template directories found")
+
+            # Create Jinja2 environment
+            loader = FileSystemLoader(template_dirs)
+            env = Environment(
+                loader=loader,
+                autoescape=True,
+                trim_blocks=True,
+                lstrip_blocks=True,
+                cache_size=400
+            )
+
+            # Add custom filters
+            env.filters['default'] = self._default_filter
+
+            # Add custom functions
+            env.globals['format_date'] = self._format_date
+
+            self._env_cache[brand_config.brand_path] = env
+
+        # Keep the attribute pointing at the active brand's environment
+        # for callers that reach for it directly
+        self.jinja_env = env
+        return env
+
     def _default_filter(self, value, default_value=""):
         """Custom default filter that handles None and empty strings."""
         if value is None or value == "":
@@ -129,13 +239,13 @@ class TemplateEngine:
             ValueError: If template configuration is invalid
         """
         # Configure Jinja2 for this brand
-        self._configure_jinja_for_brand(brand_config)
-        
+        env = self._configure_jinja_for_brand(brand_config)
+
         # Get template filename
         template_filename = self._get_template_filename(brand_config, template_type)
-        
+
         try:
-            template = self.jinja_env.get_template(template_filename)
+            template = env.get_template(template_filename)
         except TemplateNotFound as e:
             logger.error(f"Template not found: {template_filename}")
             raise TemplateNotFound(f"Template not found: {template_filename}")
@@ -182,36 +292,26 @@ class TemplateEngine:
         Returns:
             Template filename
         """
-        # Check if specific template is configured in brand
-        if template_type in brand_config.templates:
-            template_filename = brand_config.templates[template_type]
-            
+        configured = brand_config.templates.get(template_type)
+        cache_key = (configured, template_type)
+        cached = self._filename_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if configured is not None:
+            template_filename = configured
+
             # Handle relative paths
             if not template_filename.endswith('.html'):
                 template_filename += '.html'
-                
-            return template_filename
-        
-        # Use default template mapping
-        template_mapping = {
-            "document": "document.html",
-            "cover": "cover.html", 
-            "letter": "letter.html",
-            "report": "report.html",
-            "checklist": "checklist.html",
-            "invoice": "invoice.html",
-            "presentation": "presentation.html", 
-            "contract": "contract.html",
-            "newsletter": "newsletter.html",
-            "brochure": "brochure.html",
-            "proposal": "proposal.html"
-        }
-        
-        if template_type not in template_mapping:
+        elif template_type in _TEMPLATE_MAPPING:
+            template_filename = _TEMPLATE_MAPPING[template_type]
+        else:
             logger.warning(f"Unknown template type: {template_type}, using 'document'")
-            template_type = "document"
-            
-        return template_mapping[template_type]
+            template_filename = _TEMPLATE_MAPPING["document"]
+
+        self._filename_cache[cache_key] = template_filename
+        return template_filename
         
     def _build_template_context(
         self,
@@ -282,24 +382,40 @@ class TemplateEngine:
     def _build_complete_css(self, brand_config: BrandConfig) -> str:
         """
         Build complete CSS including variables and brand stylesheet.
-        
+
+        The assembled CSS is cached against the brand and the stylesheet's
+        mtime, so repeated renders skip re-reading and re-joining it until
+        the file actually changes.
+
         Args:
             brand_config: Brand configuration
-            
+
         Returns:
             Complete CSS string
         """
+        css_file_path = brand_config.assets.get("css")
+        mtime = None
+        if css_file_path:
+            try:
+                mtime = Path(css_file_path).stat().st_mtime_ns
+            except OSError:
+                mtime = None
+
+        cache_key = (brand_config.name, brand_config.css_variables, css_file_path, mtime)
+        cached = self._css_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         css_parts = []
-        
+
         # Add CSS variables
         if brand_config.css_variables:
             css_parts.append(brand_config.css_variables)
-            
+
         # Add brand-specific CSS file content
-        css_file_path = brand_config.assets.get("css")
         if css_file_path:
             css_path = Path(css_file_path)
-            if css_path.exists():
+            if mtime is not None:
                 try:
                     with open(css_path, 'r', encoding='utf-8') as f:
                         css_content = f.read()
@@ -309,84 +425,22 @@ class TemplateEngine:
                     logger.warning(f"Failed to load CSS file {css_path}: {e}")
             else:
                 logger.warning(f"CSS file not found: {css_path}")
-                
+
         # Add default PDF-friendly styles
-        css_parts.append(self._get_default_pdf_styles())
-        
-        return "\n\n".join(css_parts)
-        
+        css_parts.append(_DEFAULT_PDF_STYLES)
+
+        complete_css = "\n\n".join(css_parts)
+        self._css_cache[cache_key] = complete_css
+        return complete_css
+
     def _get_default_pdf_styles(self) -> str:
         """
         Get default PDF-friendly CSS styles.
-        
+
         Returns:
             Default CSS styles for PDF generation
         """
-        return """
-/* Default PDF-friendly styles */
-body {
-    line-height: 1.4;
-    color: #333;
-    font-size: 11pt;
-    max-width: none;
-}
-
-.page-break {
-    page-break-before: always;
-}
-
-.no-break {
-    page-break-inside: avoid;
-}
-
-h1, h2, h3, h4, h5, h6 {
-    page-break-after: avoid;
-    margin-top: 1em;
-    margin-bottom: 0.5em;
-}
-
-.emergency-callout {
-    background-color: var(--color-error-light, #FEE2E2);
-    border-left: 4px solid var(--color-error, #EF4444);
-    padding: 1em;
-    margin: 1em 0;
-    page-break-inside: avoid;
-}
-
-.highlight {
-    background-color: var(--color-warning-light, #FEF3C7);
-    padding: 0.2em 0.4em;
-    border-radius: 3px;
-}
-
-.brand-cta {
-    background-color: var(--color-primary, #1E3A8A);
-    color: white;
-    padding: 1em;
-    text-align: center;
-    margin: 1.5em 0;
-    border-radius: 5px;
-    page-break-inside: avoid;
-}
-
-.checklist-item {
-    margin: 0.5em 0;
-    padding-left: 1.5em;
-    text-indent: -1.5em;
-}
-
-.checklist-item.checked {
-    color: var(--color-success, #10B981);
-}
-
-.footer {
-    margin-top: 2em;
-    padding-top: 1em;
-    border-top: 1px solid var(--color-text-light, #6B7280);
-    font-size: 0.9em;
-    color: var(--color-text-light, #6B7280);
-}
-"""
+        return _DEFAULT_PDF_STYLES
         
     def get_available_templates(self, brand_config: BrandConfig) -> list:
         """
@@ -398,33 +452,26 @@ h1, h2, h3, h4, h5, h6 {
         Returns:
             List of available template names
         """
-        self._configure_jinja_for_brand(brand_config)
-        
+        env = self._configure_jinja_for_brand(brand_config)
+
         available = []
-        
+
+        # One loader listing replaces a parse-and-compile get_template
+        # probe per candidate name
+        existing = set(env.loader.list_templates())
+
         # Check configured templates
         for template_type, template_file in brand_config.templates.items():
-            try:
-                self.jinja_env.get_template(template_file)
+            if template_file in existing:
                 available.append(template_type)
-            except TemplateNotFound:
+            else:
                 logger.warning(f"Configured template not found: {template_file}")
-                
+
         # Check standard templates
-        standard_templates = [
-            "document.html", "cover.html", "letter.html", "report.html", "checklist.html",
-            "invoice.html", "presentation.html", "contract.html", "newsletter.html", 
-            "brochure.html", "proposal.html"
-        ]
-        for template_file in standard_templates:
-            try:
-                self.jinja_env.get_template(template_file)
-                template_name = template_file.replace('.html', '')
-                if template_name not in available:
-                    available.append(template_name)
-            except TemplateNotFound:
-                pass
-                
+        for template_type, template_file in _TEMPLATE_MAPPING.items():
+            if template_type not in available and template_file in existing:
+                available.append(template_type)
+
         return sorted(available)
         
     def validate_template(self, brand_config: BrandConfig, template_type: str) -> list:
@@ -441,17 +488,22 @@ h1, h2, h3, h4, h5, h6 {
         warnings = []
         
         try:
-            self._configure_jinja_for_brand(brand_config)
+            env = self._configure_jinja_for_brand(brand_config)
             template_filename = self._get_template_filename(brand_config, template_type)
-            template = self.jinja_env.get_template(template_filename)
-            
-            # Check for required template variables
-            source = self.jinja_env.loader.get_source(self.jinja_env, template_filename)
+            template = env.get_template(template_filename)
+
+            # Check for required template variables with a single scan:
+            # collect the leading identifier of every Jinja tag, then
+            # compare against the required set
+            source = env.loader.get_source(env, template_filename)
             template_source = source[0]
-            
-            required_vars = ["content", "brand", "title"]
-            for var in required_vars:
-                if f"{{{{ {var}" not in template_source and f"{{%- {var}" not in template_source:
+
+            used_vars = {
+                match.group(1).split('.')[0]
+                for match in _JINJA_ID_RE.finditer(template_source)
+            }
+            for var in ("content", "brand", "title"):
+                if var not in used_vars:
                     warnings.append(f"Template may be missing required variable: {var}")
                     
         except TemplateNotFound: